@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Float comparison helpers shared by the binding tests
+"""
+
+import math
+
+
+def allclose(actual, expected, tol=1e-6):
+    """Compare two equal-length float sequences within an absolute tolerance"""
+    return len(actual) == len(expected) and all(
+        math.isclose(a, e, abs_tol=tol) for a, e in zip(actual, expected)
+    )
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Shared import of magicbot_z1_python for the binding tests
+Falls back to the mocks in _mock.py when the built module is not available
+"""
+
+import os
+import sys
+
+# Add the SDK root directory to the path to import magicbot_z1_python
+_SDK_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+_magicbot = None
+
+
+def add_sdk_root():
+    """Put the SDK root on sys.path once, however many test files ask for it"""
+    if _SDK_ROOT not in sys.path:
+        sys.path.append(_SDK_ROOT)
+
+
+def get_magicbot(allow_mock=True):
+    """Return the magicbot_z1_python module, importing it on first use only
+
+    With allow_mock=False a missing module raises ImportError instead of
+    falling back to the mocks, for tests whose structs have no mock
+    """
+    if not allow_mock:
+        add_sdk_root()
+        import magicbot_z1_python
+
+        return magicbot_z1_python
+
+    global _magicbot
+    if _magicbot is None:
+        _magicbot = _import_magicbot()
+    return _magicbot
+
+
+def _import_magicbot():
+    add_sdk_root()
+
+    try:
+        import magicbot_z1_python
+
+        return magicbot_z1_python
+    except ImportError as e:
+        print(f"Error importing magicbot_z1_python: {e}")
+        print("\n🔧 Troubleshooting steps:")
+        print("1. Make sure the SDK is built:")
+        print("   cd /path/to/magicbot_z1_sdk")
+        print("   chmod +x build.sh")
+        print("   ./build.sh")
+        print("\n2. If the module is built but not installed, you may need to:")
+        print("   - Add the build directory to PYTHONPATH")
+        print("   - Or install the module to your Python environment")
+        print("\n3. Check if the module exists in the build directory:")
+        print("   find . -name '*magicbot*' -type f")
+        print("\n4. If you're in a development environment, you might need to:")
+        print("   export PYTHONPATH=/path/to/magicbot_z1_sdk/build:$PYTHONPATH")
+        print(
+            "\n📝 For now, this test will show the expected structure without running actual tests."
+        )
+
+        # Use the mock module for demonstration
+        from _mock import MockMagicbot
+
+        print("\n✅ Using mock module for demonstration purposes.")
+        print("   (Replace with actual module when available)")
+        return MockMagicbot()
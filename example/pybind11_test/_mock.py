@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Mock stand-ins for the magicbot_z1_python bindings
+Only imported by the tests when the real module cannot be loaded
+"""
+
+
+class MockJoystickCommand:
+    __slots__ = ("left_x_axis", "left_y_axis", "right_x_axis", "right_y_axis")
+
+    def __init__(self):
+        self.left_x_axis = 0.0
+        self.left_y_axis = 0.0
+        self.right_x_axis = 0.0
+        self.right_y_axis = 0.0
+
+
+class MockNavStatusType:
+    NONE = 0
+    RUNNING = 1
+    END_SUCCESS = 2
+    END_FAILED = 3
+    PAUSE = 4
+    CONTINUE = 5
+    CANCEL = 6
+
+
+class MockNavStatus:
+    __slots__ = ("id", "status", "error_code", "error_desc")
+
+    def __init__(self):
+        self.id = -1
+        self.status = MockNavStatusType.NONE
+        self.error_code = 0
+        self.error_desc = ""
+
+
+class MockErrorCode:
+    OK = 0
+    SERVICE_NOT_READY = 1
+    TIMEOUT = 2
+    INTERNAL_ERROR = 3
+    SERVICE_ERROR = 4
+
+
+class MockBatteryState:
+    UNKNOWN = 0
+    GOOD = 1
+    OVERHEAT = 2
+    DEAD = 3
+    OVERVOLTAGE = 4
+    UNSPEC_FAILURE = 5
+    COLD = 6
+    WATCHDOG_TIMER_EXPIRE = 7
+    SAFETY_TIMER_EXPIRE = 8
+
+
+class MockPowerSupplyStatus:
+    UNKNOWN = 0
+    CHARGING = 1
+    DISCHARGING = 2
+    NOTCHARGING = 3
+    FULL = 4
+
+
+class MockTtsPriority:
+    HIGH = 0
+    MIDDLE = 1
+    LOW = 2
+
+
+class MockTtsMode:
+    CLEARTOP = 0
+    ADD = 1
+    CLEARBUFFER = 2
+
+
+_ZERO3 = (0.0, 0.0, 0.0)
+
+
+class _MockStruct:
+    """Mock struct filled in from a per-class prototype of field defaults"""
+
+    # Subclasses declare __slots__ = tuple(_prototype), so instances carry
+    # no per-instance __dict__ and unknown attributes fail as on the binding
+    __slots__ = ()
+    _prototype = {}
+
+    def __init__(self):
+        # Copy the prebuilt defaults instead of running a constructor body
+        # per class; sequence defaults are stored as immutable tuples and
+        # turned into lists here, and nested structs are built fresh, so
+        # instances never share mutable state
+        for name, value in self._prototype.items():
+            if isinstance(value, tuple):
+                value = list(value)
+            elif isinstance(value, type):
+                value = value()
+            setattr(self, name, value)
+
+
+class MockPose3DEuler(_MockStruct):
+    _prototype = {"position": _ZERO3, "orientation": _ZERO3}
+    __slots__ = tuple(_prototype)
+
+
+class MockPoint2D(_MockStruct):
+    _prototype = {"x": 0.0, "y": 0.0}
+    __slots__ = tuple(_prototype)
+
+
+class MockPointField(_MockStruct):
+    _prototype = {"name": "", "offset": 0, "datatype": 0, "count": 0}
+    __slots__ = tuple(_prototype)
+
+
+class MockPolyRegion(_MockStruct):
+    _prototype = {"points": ()}
+    __slots__ = tuple(_prototype)
+
+
+class MockFault(_MockStruct):
+    _prototype = {"error_code": 0, "error_message": ""}
+    __slots__ = tuple(_prototype)
+
+
+class MockBmsData(_MockStruct):
+    _prototype = {
+        "battery_percentage": 0.0,
+        "battery_health": 0.0,
+        "battery_state": MockBatteryState.UNKNOWN,
+        "power_supply_status": MockPowerSupplyStatus.UNKNOWN,
+    }
+    __slots__ = tuple(_prototype)
+
+
+class MockRobotState(_MockStruct):
+    _prototype = {"faults": (), "bms_data": MockBmsData}
+    __slots__ = tuple(_prototype)
+
+
+class MockStatus(_MockStruct):
+    _prototype = {"code": 0, "message": ""}
+    __slots__ = tuple(_prototype)
+
+
+class MockMapImageData(_MockStruct):
+    _prototype = {
+        "width": 0,
+        "height": 0,
+        "max_gray_value": 0,
+        "type": "",
+        "image": (),
+    }
+    __slots__ = tuple(_prototype)
+
+
+# Nested structs are default-constructed, as in the real binding
+class MockNavTarget(_MockStruct):
+    _prototype = {"id": 0, "frame_id": "", "goal": MockPose3DEuler}
+    __slots__ = tuple(_prototype)
+
+
+class MockMapMetaData(_MockStruct):
+    _prototype = {
+        "resolution": 0.0,
+        "origin": MockPose3DEuler,
+        "map_image_data": MockMapImageData,
+    }
+    __slots__ = tuple(_prototype)
+
+
+class MockMapInfo(_MockStruct):
+    _prototype = {"map_name": "", "map_meta_data": MockMapMetaData}
+    __slots__ = tuple(_prototype)
+
+
+class MockAllMapInfo(_MockStruct):
+    _prototype = {"current_map_name": "", "map_infos": ()}
+    __slots__ = tuple(_prototype)
+
+
+class MockLocalizationInfo(_MockStruct):
+    _prototype = {"is_localization": False, "pose": MockPose3DEuler}
+    __slots__ = tuple(_prototype)
+
+
+class MockSingleJointCommand(_MockStruct):
+    _prototype = {
+        "operation_mode": 200,
+        "pos": 0.0,
+        "vel": 0.0,
+        "toq": 0.0,
+        "kp": 0.0,
+        "kd": 0.0,
+    }
+    __slots__ = tuple(_prototype)
+
+
+class MockJointCommand(_MockStruct):
+    _prototype = {"timestamp": 0, "joints": ()}
+    __slots__ = tuple(_prototype)
+
+
+class MockSingleJointState(_MockStruct):
+    _prototype = {
+        "status_word": 0,
+        "posH": 0.0,
+        "posL": 0.0,
+        "vel": 0.0,
+        "toq": 0.0,
+        "current": 0.0,
+        "err_code": 0,
+    }
+    __slots__ = tuple(_prototype)
+
+
+class MockJointState(_MockStruct):
+    _prototype = {"timestamp": 0, "joints": ()}
+    __slots__ = tuple(_prototype)
+
+
+class MockTtsCommand(_MockStruct):
+    _prototype = {
+        "id": "",
+        "content": "",
+        "priority": MockTtsPriority.HIGH,
+        "mode": MockTtsMode.CLEARTOP,
+    }
+    __slots__ = tuple(_prototype)
+
+
+class MockMagicbot:
+    JoystickCommand = MockJoystickCommand
+    NavStatusType = MockNavStatusType
+    NavStatus = MockNavStatus
+    ErrorCode = MockErrorCode
+    BatteryState = MockBatteryState
+    PowerSupplyStatus = MockPowerSupplyStatus
+    TtsPriority = MockTtsPriority
+    TtsMode = MockTtsMode
+    Pose3DEuler = MockPose3DEuler
+    Point2D = MockPoint2D
+    PointField = MockPointField
+    PolyRegion = MockPolyRegion
+    Fault = MockFault
+    BmsData = MockBmsData
+    RobotState = MockRobotState
+    Status = MockStatus
+    NavTarget = MockNavTarget
+    MapImageData = MockMapImageData
+    MapMetaData = MockMapMetaData
+    MapInfo = MockMapInfo
+    AllMapInfo = MockAllMapInfo
+    LocalizationInfo = MockLocalizationInfo
+    SingleJointCommand = MockSingleJointCommand
+    JointCommand = MockJointCommand
+    SingleJointState = MockSingleJointState
+    JointState = MockJointState
+    TtsCommand = MockTtsCommand
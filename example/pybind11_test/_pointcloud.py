@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Point cloud field layouts shared by the PointField and PointCloud2 tests
+"""
+
+# (name, offset, datatype, count) of an x/y/z/intensity cloud, 4 bytes per float
+# and FLOAT32 = 7
+XYZI_FIELDS = (
+    ("x", 0, 7, 1),
+    ("y", 4, 7, 1),
+    ("z", 8, 7, 1),
+    ("intensity", 12, 7, 1),
+)
+
+
+def make_fields(magicbot, configs):
+    """Build one PointField per (name, offset, datatype, count) tuple"""
+    PointField = magicbot.PointField
+    fields = []
+    for name, offset, datatype, count in configs:
+        field = PointField()
+        field.name = name
+        field.offset = offset
+        field.datatype = datatype
+        field.count = count
+        fields.append(field)
+    return fields
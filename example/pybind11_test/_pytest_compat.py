@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+pytest decorators for the binding tests that still import when the tests run
+as scripts without pytest installed
+"""
+
+from types import SimpleNamespace
+
+try:
+    import pytest
+except ImportError:
+
+    def _passthrough(*args, **kwargs):
+        # Bare use (@pytest.mark.slow) hands over the function itself; called
+        # use (@pytest.fixture(scope=...)) needs a decorator back
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    # Only the decorators are needed off pytest; main() drives the tests itself
+    pytest = SimpleNamespace(
+        fixture=_passthrough,
+        mark=SimpleNamespace(parametrize=_passthrough, slow=_passthrough),
+    )
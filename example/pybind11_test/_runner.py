@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Script-mode runner shared by the binding tests' main() functions
+"""
+
+
+def run_all(tests):
+    """Run each test callable in order, returning 0 on success and 1 on failure"""
+    try:
+        for test in tests:
+            test()
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+    return 0
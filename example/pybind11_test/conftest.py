@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the pybind11 binding tests
+"""
+
+import pytest
+from _import_helper import add_sdk_root
+
+# Add the SDK root directory to the path once per session to import magicbot_z1_python
+add_sdk_root()
+
+
+def pytest_configure(config):
+    # Edge-case sweeps can be left out of the inner dev loop with -m "not slow"
+    config.addinivalue_line("markers", "slow: edge-case sweeps over limit values")
+
+
+@pytest.fixture(scope="session")
+def magicbot():
+    """The magicbot_z1_python module, imported once per session"""
+    return pytest.importorskip("magicbot_z1_python")
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
 import sys
-import magicbot_z1_python as magicbot
+from _pytest_compat import pytest
+from _compare import allclose
+from _import_helper import get_magicbot
 
 
-def test_imu_basic_fields():
+def test_imu_basic_fields(magicbot):
     """Test basic fields of Imu struct"""
     print("=== Testing Imu Basic Fields ===")
 
@@ -35,124 +37,55 @@ def test_imu_basic_fields():
     return True
 
 
-def test_imu_orientation():
-    """Test orientation quaternion field"""
-    print("\n=== Testing Imu Orientation (Quaternion) ===")
+# (field, first value, second value) for each vector field of Imu
+_IMU_VECTOR_CASES = (
+    # Identity quaternion, then a 90-degree rotation around the X-axis
+    ("orientation", [0.0, 0.0, 0.0, 1.0], [0.707, 0.0, 0.0, 0.707]),
+    # rad/s
+    ("angular_velocity", [0.1, 0.2, 0.3], [-0.5, 1.0, -0.8]),
+    # m/s^2 (gravity first)
+    ("linear_acceleration", [0.0, 0.0, 9.81], [2.5, -1.8, 8.2]),
+)
 
-    imu = magicbot.Imu()
-
-    # Test quaternion (4 elements: x, y, z, w)
-    test_orientation = [0.0, 0.0, 0.0, 1.0]  # Identity quaternion
-    print(f"   Setting orientation quaternion: {test_orientation}")
-
-    # Set orientation
-    imu.orientation = test_orientation
-    print(f"   Orientation after set: {imu.orientation}")
-
-    # Verify the values
-    for i, expected in enumerate(test_orientation):
-        assert (
-            abs(imu.orientation[i] - expected) < 1e-6
-        ), f"Orientation[{i}] mismatch: expected {expected}, got {imu.orientation[i]}"
-
-    # Test different quaternion
-    test_orientation2 = [0.707, 0.0, 0.0, 0.707]  # 90-degree rotation around X-axis
-    print(f"   Setting new orientation: {test_orientation2}")
-    imu.orientation = test_orientation2
-
-    for i, expected in enumerate(test_orientation2):
-        assert (
-            abs(imu.orientation[i] - expected) < 1e-6
-        ), f"Orientation[{i}] mismatch: expected {expected}, got {imu.orientation[i]}"
-
-    print("   ✓ Orientation test passed")
-    return True
-
-
-def test_imu_angular_velocity():
-    """Test angular velocity field"""
-    print("\n=== Testing Imu Angular Velocity ===")
-
-    imu = magicbot.Imu()
-
-    # Test angular velocity (3 elements: x, y, z)
-    test_angular_velocity = [0.1, 0.2, 0.3]  # rad/s
-    print(f"   Setting angular velocity: {test_angular_velocity}")
-
-    # Set angular velocity
-    imu.angular_velocity = test_angular_velocity
-    print(f"   Angular velocity after set: {imu.angular_velocity}")
 
-    # Verify the values
-    for i, expected in enumerate(test_angular_velocity):
-        assert (
-            abs(imu.angular_velocity[i] - expected) < 1e-6
-        ), f"Angular velocity[{i}] mismatch: expected {expected}, got {imu.angular_velocity[i]}"
+@pytest.fixture(scope="module")
+def imu(magicbot):
+    """Shared Imu instance for the vector field tests"""
+    return magicbot.Imu()
 
-    # Test different values
-    test_angular_velocity2 = [-0.5, 1.0, -0.8]
-    print(f"   Setting new angular velocity: {test_angular_velocity2}")
-    imu.angular_velocity = test_angular_velocity2
 
-    for i, expected in enumerate(test_angular_velocity2):
-        assert (
-            abs(imu.angular_velocity[i] - expected) < 1e-6
-        ), f"Angular velocity[{i}] mismatch: expected {expected}, got {imu.angular_velocity[i]}"
+@pytest.mark.parametrize(
+    "field,first,second", _IMU_VECTOR_CASES, ids=[c[0] for c in _IMU_VECTOR_CASES]
+)
+def test_imu_vector_field(imu, field, first, second):
+    """Test a vector field of Imu (orientation, angular velocity, linear acceleration)"""
+    print(f"\n=== Testing Imu {field} ({len(first)} elements) ===")
 
-    print("   ✓ Angular velocity test passed")
-    return True
-
-
-def test_imu_linear_acceleration():
-    """Test linear acceleration field"""
-    print("\n=== Testing Imu Linear Acceleration ===")
-
-    imu = magicbot.Imu()
-
-    # Test linear acceleration (3 elements: x, y, z)
-    test_linear_acceleration = [0.0, 0.0, 9.81]  # m/s^2 (gravity)
-    print(f"   Setting linear acceleration: {test_linear_acceleration}")
-
-    # Set linear acceleration
-    imu.linear_acceleration = test_linear_acceleration
-    print(f"   Linear acceleration after set: {imu.linear_acceleration}")
+    for value in (first, second):
+        print(f"   Setting {field}: {value}")
+        setattr(imu, field, value)
 
-    # Verify the values
-    for i, expected in enumerate(test_linear_acceleration):
-        assert (
-            abs(imu.linear_acceleration[i] - expected) < 1e-6
-        ), f"Linear acceleration[{i}] mismatch: expected {expected}, got {imu.linear_acceleration[i]}"
+        actual = list(getattr(imu, field))
+        print(f"   {field} after set: {actual}")
+        assert allclose(
+            actual, value
+        ), f"{field} mismatch: expected {value}, got {actual}"
 
-    # Test different values
-    test_linear_acceleration2 = [2.5, -1.8, 8.2]
-    print(f"   Setting new linear acceleration: {test_linear_acceleration2}")
-    imu.linear_acceleration = test_linear_acceleration2
-
-    for i, expected in enumerate(test_linear_acceleration2):
-        assert (
-            abs(imu.linear_acceleration[i] - expected) < 1e-6
-        ), f"Linear acceleration[{i}] mismatch: expected {expected}, got {imu.linear_acceleration[i]}"
-
-    print("   ✓ Linear acceleration test passed")
-    return True
-
-
-if __name__ == "__main__":
-    test_imu_basic_fields()
-    test_imu_orientation()
-    test_imu_angular_velocity()
-    test_imu_linear_acceleration()
+    print(f"   ✓ {field} test passed")
 
 
 def main():
     """Main test function"""
+    # No mock for these structs, so fail loudly without the built module
+    magicbot = get_magicbot(allow_mock=False)
+
     try:
         print("Starting Imu binding tests...")
 
-        test_imu_basic_fields()
-        test_imu_orientation()
-        test_imu_angular_velocity()
-        test_imu_linear_acceleration()
+        test_imu_basic_fields(magicbot)
+        imu = magicbot.Imu()
+        for case in _IMU_VECTOR_CASES:
+            test_imu_vector_field(imu, *case)
 
         print("\n🎉 All Imu binding tests completed successfully!")
         print("\nSummary:")
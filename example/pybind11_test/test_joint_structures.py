@@ -5,70 +5,11 @@ Tests basic read/write operations for all fields
 """
 
 import sys
-import os
-
-# Add the parent directory to the path to import magicbot_z1_python
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
-
-try:
-    import magicbot_z1_python as magicbot
-except ImportError as e:
-    print(f"Error importing magicbot_z1_python: {e}")
-    print("\n🔧 Troubleshooting steps:")
-    print("1. Make sure the SDK is built:")
-    print("   cd /path/to/magicbot_z1_sdk")
-    print("   chmod +x build.sh")
-    print("   ./build.sh")
-    print("\n2. If the module is built but not installed, you may need to:")
-    print("   - Add the build directory to PYTHONPATH")
-    print("   - Or install the module to your Python environment")
-    print("\n3. Check if the module exists in the build directory:")
-    print("   find . -name '*magicbot*' -type f")
-    print("\n4. If you're in a development environment, you might need to:")
-    print("   export PYTHONPATH=/path/to/magicbot_z1_sdk/build:$PYTHONPATH")
-    print(
-        "\n📝 For now, this test will show the expected structure without running actual tests."
-    )
+from _compare import allclose
+from _import_helper import get_magicbot
+
 
-    # Create a mock module for demonstration
-    class MockMagicbot:
-        class SingleJointCommand:
-            def __init__(self):
-                self.operation_mode = 200
-                self.pos = 0.0
-                self.vel = 0.0
-                self.toq = 0.0
-                self.kp = 0.0
-                self.kd = 0.0
-
-        class JointCommand:
-            def __init__(self):
-                self.timestamp = 0
-                self.joints = []
-
-        class SingleJointState:
-            def __init__(self):
-                self.status_word = 0
-                self.posH = 0.0
-                self.posL = 0.0
-                self.vel = 0.0
-                self.toq = 0.0
-                self.current = 0.0
-                self.err_code = 0
-
-        class JointState:
-            def __init__(self):
-                self.timestamp = 0
-                self.joints = []
-
-    magicbot = MockMagicbot()
-    print("\n✅ Using mock module for demonstration purposes.")
-    print("   (Replace with actual module when available)")
-
-
-def test_single_joint_command():
+def test_single_joint_command(magicbot):
     """Test SingleJointCommand structure"""
     print("=== Testing SingleJointCommand ===")
 
@@ -101,17 +42,17 @@ def test_single_joint_command():
 
     # Verify values
     assert joint_cmd.operation_mode == 100
-    assert 1.57 - 1e-6 < joint_cmd.pos < 1.57 + 1e-6
-    assert 2.0 - 1e-6 < joint_cmd.vel < 2.0 + 1e-6
-    assert 10.5 - 1e-6 < joint_cmd.toq < 10.5 + 1e-6
-    assert 100.0 - 1e-6 < joint_cmd.kp < 100.0 + 1e-6
-    assert 20.0 - 1e-6 < joint_cmd.kd < 20.0 + 1e-6
+    actual = (joint_cmd.pos, joint_cmd.vel, joint_cmd.toq, joint_cmd.kp, joint_cmd.kd)
+    expected = (1.57, 2.0, 10.5, 100.0, 20.0)
+    assert allclose(
+        actual, expected
+    ), f"SingleJointCommand pos/vel/toq/kp/kd mismatch: expected {expected}, got {actual}"
 
     print("   ✓ SingleJointCommand test passed")
     return True
 
 
-def test_joint_command():
+def test_joint_command(magicbot):
     """Test JointCommand structure"""
     print("\n=== Testing JointCommand ===")
 
@@ -130,8 +71,10 @@ def test_joint_command():
 
     # Test adding joints
     print("   Testing adding joints:")
+    SingleJointCommand = magicbot.SingleJointCommand
+    append_joint = joint_cmd.joints.append
     for i in range(3):
-        single_joint = magicbot.SingleJointCommand()
+        single_joint = SingleJointCommand()
         single_joint.operation_mode = 200 + i
         single_joint.pos = 0.5 + i * 0.1
         single_joint.vel = 1.0 + i * 0.2
@@ -139,7 +82,7 @@ def test_joint_command():
         single_joint.kp = 50.0 + i * 10.0
         single_joint.kd = 10.0 + i * 2.0
 
-        joint_cmd.joints.append(single_joint)
+        append_joint(single_joint)
         print(
             f"     Added joint {i}: operation_mode={single_joint.operation_mode}, pos={single_joint.pos}"
         )
@@ -148,19 +91,33 @@ def test_joint_command():
     assert len(joint_cmd.joints) == 3
 
     # Verify joint values
-    for i, joint in enumerate(joint_cmd.joints):
-        assert joint.operation_mode == 200 + i
-        assert 0.5 + i * 0.1 - 1e-6 < joint.pos < 0.5 + i * 0.1 + 1e-6
-        assert 1.0 + i * 0.2 - 1e-6 < joint.vel < 1.0 + i * 0.2 + 1e-6
-        assert 5.0 + i * 1.0 - 1e-6 < joint.toq < 5.0 + i * 1.0 + 1e-6
-        assert 50.0 + i * 10.0 - 1e-6 < joint.kp < 50.0 + i * 10.0 + 1e-6
-        assert 10.0 + i * 2.0 - 1e-6 < joint.kd < 10.0 + i * 2.0 + 1e-6
+    joints = joint_cmd.joints
+    assert [joint.operation_mode for joint in joints] == [200, 201, 202]
+    actual = [
+        value
+        for joint in joints
+        for value in (joint.pos, joint.vel, joint.toq, joint.kp, joint.kd)
+    ]
+    expected = [
+        value
+        for i in range(3)
+        for value in (
+            0.5 + i * 0.1,
+            1.0 + i * 0.2,
+            5.0 + i * 1.0,
+            50.0 + i * 10.0,
+            10.0 + i * 2.0,
+        )
+    ]
+    assert allclose(
+        actual, expected
+    ), f"JointCommand joints pos/vel/toq/kp/kd mismatch: expected {expected}, got {actual}"
 
     print("   ✓ JointCommand test passed")
     return True
 
 
-def test_single_joint_state():
+def test_single_joint_state(magicbot):
     """Test SingleJointState structure"""
     print("\n=== Testing SingleJointState ===")
 
@@ -195,19 +152,24 @@ def test_single_joint_state():
     print(f"     Set err_code: {joint_state.err_code}")
 
     # Verify values
-    assert joint_state.status_word == 1234
-    assert 1.23 - 1e-6 < joint_state.posH < 1.23 + 1e-6
-    assert 1.24 - 1e-6 < joint_state.posL < 1.24 + 1e-6
-    assert 0.5 - 1e-6 < joint_state.vel < 0.5 + 1e-6
-    assert 8.0 - 1e-6 < joint_state.toq < 8.0 + 1e-6
-    assert 2.5 - 1e-6 < joint_state.current < 2.5 + 1e-6
-    assert joint_state.err_code == 0
+    assert (joint_state.status_word, joint_state.err_code) == (1234, 0)
+    actual = (
+        joint_state.posH,
+        joint_state.posL,
+        joint_state.vel,
+        joint_state.toq,
+        joint_state.current,
+    )
+    expected = (1.23, 1.24, 0.5, 8.0, 2.5)
+    assert allclose(
+        actual, expected
+    ), f"SingleJointState posH/posL/vel/toq/current mismatch: expected {expected}, got {actual}"
 
     print("   ✓ SingleJointState test passed")
     return True
 
 
-def test_joint_state():
+def test_joint_state(magicbot):
     """Test JointState structure"""
     print("\n=== Testing JointState ===")
 
@@ -226,8 +188,10 @@ def test_joint_state():
 
     # Test adding joint states
     print("   Testing adding joint states:")
+    SingleJointState = magicbot.SingleJointState
+    append_state = joint_state.joints.append
     for i in range(3):
-        single_state = magicbot.SingleJointState()
+        single_state = SingleJointState()
         single_state.status_word = 1000 + i
         single_state.posH = 0.1 + i * 0.2
         single_state.posL = 0.11 + i * 0.2
@@ -236,7 +200,7 @@ def test_joint_state():
         single_state.current = 1.0 + i * 0.3
         single_state.err_code = i
 
-        joint_state.joints.append(single_state)
+        append_state(single_state)
         print(
             f"     Added joint state {i}: status_word={single_state.status_word}, posH={single_state.posH}"
         )
@@ -245,20 +209,37 @@ def test_joint_state():
     assert len(joint_state.joints) == 3
 
     # Verify joint state values
-    for i, state in enumerate(joint_state.joints):
-        assert state.status_word == 1000 + i
-        assert 0.1 + i * 0.2 - 1e-6 < state.posH < 0.1 + i * 0.2 + 1e-6
-        assert 0.11 + i * 0.2 - 1e-6 < state.posL < 0.11 + i * 0.2 + 1e-6
-        assert 0.3 + i * 0.1 - 1e-6 < state.vel < 0.3 + i * 0.1 + 1e-6
-        assert 3.0 + i * 0.5 - 1e-6 < state.toq < 3.0 + i * 0.5 + 1e-6
-        assert 1.0 + i * 0.3 - 1e-6 < state.current < 1.0 + i * 0.3 + 1e-6
-        assert state.err_code == i
+    states = joint_state.joints
+    assert [(state.status_word, state.err_code) for state in states] == [
+        (1000, 0),
+        (1001, 1),
+        (1002, 2),
+    ]
+    actual = [
+        value
+        for state in states
+        for value in (state.posH, state.posL, state.vel, state.toq, state.current)
+    ]
+    expected = [
+        value
+        for i in range(3)
+        for value in (
+            0.1 + i * 0.2,
+            0.11 + i * 0.2,
+            0.3 + i * 0.1,
+            3.0 + i * 0.5,
+            1.0 + i * 0.3,
+        )
+    ]
+    assert allclose(
+        actual, expected
+    ), f"JointState joints posH/posL/vel/toq/current mismatch: expected {expected}, got {actual}"
 
     print("   ✓ JointState test passed")
     return True
 
 
-def test_joint_structures_comprehensive():
+def test_joint_structures_comprehensive(magicbot):
     """Test comprehensive joint structures"""
     print("\n=== Testing Joint Structures Comprehensive ===")
 
@@ -274,15 +255,17 @@ def test_joint_structures_comprehensive():
         (202, 3.14, 1.5, 15.0, 200.0, 40.0),  # Torque control
     ]
 
+    SingleJointCommand = magicbot.SingleJointCommand
+    append_joint = joint_cmd.joints.append
     for i, (mode, pos, vel, toq, kp, kd) in enumerate(joint_configs):
-        joint = magicbot.SingleJointCommand()
+        joint = SingleJointCommand()
         joint.operation_mode = mode
         joint.pos = pos
         joint.vel = vel
         joint.toq = toq
         joint.kp = kp
         joint.kd = kd
-        joint_cmd.joints.append(joint)
+        append_joint(joint)
         print(f"     Joint {i}: mode={mode}, pos={pos}, vel={vel}, toq={toq}")
 
     print(f"     Total joints: {len(joint_cmd.joints)}")
@@ -300,8 +283,10 @@ def test_joint_structures_comprehensive():
         (1002, 0.5, 0.51, 0.5, 4.0, 1.6, 0),  # Loaded state
     ]
 
+    SingleJointState = magicbot.SingleJointState
+    append_state = joint_state.joints.append
     for i, (status, posH, posL, vel, toq, current, err) in enumerate(state_configs):
-        state = magicbot.SingleJointState()
+        state = SingleJointState()
         state.status_word = status
         state.posH = posH
         state.posL = posL
@@ -309,7 +294,7 @@ def test_joint_structures_comprehensive():
         state.toq = toq
         state.current = current
         state.err_code = err
-        joint_state.joints.append(state)
+        append_state(state)
         print(
             f"     State {i}: status={status}, posH={posH}, vel={vel}, current={current}"
         )
@@ -323,15 +308,17 @@ def test_joint_structures_comprehensive():
 
 def main():
     """Main test function"""
+    magicbot = get_magicbot()
+
     try:
         print("Starting JointState and JointCommand binding tests...")
         print("=" * 60)
 
-        test_single_joint_command()
-        test_joint_command()
-        test_single_joint_state()
-        test_joint_state()
-        test_joint_structures_comprehensive()
+        test_single_joint_command(magicbot)
+        test_joint_command(magicbot)
+        test_single_joint_state(magicbot)
+        test_joint_state(magicbot)
+        test_joint_structures_comprehensive(magicbot)
 
         print("\n" + "=" * 60)
         print(
@@ -6,128 +6,65 @@ Tests the navigation status structures and enumeration types
 
 import sys
 import os
+from _pytest_compat import pytest
+from _import_helper import get_magicbot
+
+# Per-iteration diagnostics are only printed when MAGICBOT_TEST_VERBOSE=1
+VERBOSE = os.environ.get("MAGICBOT_TEST_VERBOSE") == "1"
+
+# (name, id, NavStatusType member, error_code, error_desc)
+_NAV_SCENARIOS = (
+    ("Navigation Start", 1, "RUNNING", 1, "Navigation started to target point 1"),
+    ("Navigation Success", 1, "END_SUCCESS", 0, "Successfully reached target point 1"),
+    (
+        "Navigation Failed",
+        2,
+        "END_FAILED",
+        1,
+        "Failed to reach target point 2: obstacle detected",
+    ),
+    ("Navigation Paused", 3, "PAUSE", 1, "Navigation paused by user command"),
+    ("Navigation Resumed", 3, "CONTINUE", 1, "Navigation resumed from pause"),
+    ("Navigation Cancelled", -1, "CANCEL", 1, "Navigation cancelled by user"),
+    ("No Target", -1, "NONE", 1, "No navigation target set"),
+)
+
 
-# Add the parent directory to the path to import magicbot_z1_python
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# (name, value) of every NavStatusType member
+_NAV_STATUS_TYPE_VALUES = (
+    ("NONE", 0),
+    ("RUNNING", 1),
+    ("END_SUCCESS", 2),
+    ("END_FAILED", 3),
+    ("PAUSE", 4),
+    ("CONTINUE", 5),
+    ("CANCEL", 6),
 )
 
-try:
-    import magicbot_z1_python as magicbot
-
-    print("✅ Successfully imported magicbot_z1_python")
-except ImportError as e:
-    print(f"❌ Error importing magicbot_z1_python: {e}")
-    print("\n🔧 To test this functionality:")
-    print("1. Build the SDK: ./build.sh")
-    print("2. Make sure the Python module is available")
-    print("\nFor now, showing expected behavior with mock objects...")
-
-    # Create mock objects for demonstration
-    class MockNavStatusType:
-        NONE = 0
-        RUNNING = 1
-        END_SUCCESS = 2
-        END_FAILED = 3
-        PAUSE = 4
-        CONTINUE = 5
-        CANCEL = 6
-
-    class MockNavStatus:
-        def __init__(self):
-            self.id = -1
-            self.status = MockNavStatusType.NONE
-            self.message = ""
-
-    class MockMagicbot:
-        NavStatusType = MockNavStatusType
-        NavStatus = MockNavStatus
-
-    magicbot = MockMagicbot()
-    print("📝 Using mock objects for demonstration")
-
-
-def test_nav_status_type_enum():
+
+def test_nav_status_type_enum(magicbot):
     """Test NavStatusType enumeration"""
     print("\n=== Testing NavStatusType Enumeration ===")
     print()
 
     # Test all enum values
     print("Testing enum values:")
-    print(f"  NONE: {magicbot.NavStatusType.NONE}")
-    print(f"  RUNNING: {magicbot.NavStatusType.RUNNING}")
-    print(f"  END_SUCCESS: {magicbot.NavStatusType.END_SUCCESS}")
-    print(f"  END_FAILED: {magicbot.NavStatusType.END_FAILED}")
-    print(f"  PAUSE: {magicbot.NavStatusType.PAUSE}")
-    print(f"  CONTINUE: {magicbot.NavStatusType.CONTINUE}")
-    print(f"  CANCEL: {magicbot.NavStatusType.CANCEL}")
-    print()
-
-    # Verify enum values (debug first)
-    print("Debug: Checking actual enum values:")
-    print(f"  NONE actual value: {magicbot.NavStatusType.NONE}")
-    print(f"  RUNNING actual value: {magicbot.NavStatusType.RUNNING}")
-    print(f"  END_SUCCESS actual value: {magicbot.NavStatusType.END_SUCCESS}")
-    print(f"  END_FAILED actual value: {magicbot.NavStatusType.END_FAILED}")
-    print(f"  PAUSE actual value: {magicbot.NavStatusType.PAUSE}")
-    print(f"  CONTINUE actual value: {magicbot.NavStatusType.CONTINUE}")
-    print(f"  CANCEL actual value: {magicbot.NavStatusType.CANCEL}")
-    print()
-
-    # Check if values are what we expect
-    try:
-        assert magicbot.NavStatusType.NONE == 0
-        print("✅ NONE == 0 verified")
-    except AssertionError:
-        print(f"❌ NONE != 0, actual value: {magicbot.NavStatusType.NONE}")
-
-    try:
-        assert magicbot.NavStatusType.RUNNING == 1
-        print("✅ RUNNING == 1 verified")
-    except AssertionError:
-        print(f"❌ RUNNING != 1, actual value: {magicbot.NavStatusType.RUNNING}")
-
-    try:
-        assert magicbot.NavStatusType.END_SUCCESS == 2
-        print("✅ END_SUCCESS == 2 verified")
-    except AssertionError:
-        print(
-            f"❌ END_SUCCESS != 2, actual value: {magicbot.NavStatusType.END_SUCCESS}"
-        )
-
-    try:
-        assert magicbot.NavStatusType.END_FAILED == 3
-        print("✅ END_FAILED == 3 verified")
-    except AssertionError:
-        print(f"❌ END_FAILED != 3, actual value: {magicbot.NavStatusType.END_FAILED}")
-
-    try:
-        assert magicbot.NavStatusType.PAUSE == 4
-        print("✅ PAUSE == 4 verified")
-    except AssertionError:
-        print(f"❌ PAUSE != 4, actual value: {magicbot.NavStatusType.PAUSE}")
-
-    try:
-        assert magicbot.NavStatusType.CONTINUE == 5
-        print("✅ CONTINUE == 5 verified")
-    except AssertionError:
-        print(f"❌ CONTINUE != 5, actual value: {magicbot.NavStatusType.CONTINUE}")
-
-    try:
-        assert magicbot.NavStatusType.CANCEL == 6
-        print("✅ CANCEL == 6 verified")
-    except AssertionError:
-        print(f"❌ CANCEL != 6, actual value: {magicbot.NavStatusType.CANCEL}")
+    for name, expected in _NAV_STATUS_TYPE_VALUES:
+        got = int(getattr(magicbot.NavStatusType, name))
+        print(f"  {name}: {got}")
+        assert got == expected, f"{name}: {got} != {expected}"
 
     print("✅ All enum values verified")
     print()
 
 
-def test_nav_status_structure():
+def test_nav_status_structure(magicbot):
     """Test NavStatus structure"""
     print("=== Testing NavStatus Structure ===")
     print()
 
+    NavStatusType = magicbot.NavStatusType
+
     # Test default constructor
     print("Testing default constructor:")
     nav_status = magicbot.NavStatus()
@@ -138,7 +75,7 @@ def test_nav_status_structure():
 
     # Verify initial values
     assert nav_status.id == -1
-    assert nav_status.status == magicbot.NavStatusType.NONE
+    assert nav_status.status == NavStatusType.NONE
     assert nav_status.error_code == 0
     assert nav_status.error_desc == ""
 
@@ -148,7 +85,7 @@ def test_nav_status_structure():
     # Test setting values
     print("Testing value assignment:")
     nav_status.id = 123
-    nav_status.status = magicbot.NavStatusType.RUNNING
+    nav_status.status = NavStatusType.RUNNING
     nav_status.error_code = 1
     nav_status.error_desc = "Navigation is running"
 
@@ -159,7 +96,7 @@ def test_nav_status_structure():
 
     # Verify assigned values
     assert nav_status.id == 123
-    assert nav_status.status == magicbot.NavStatusType.RUNNING
+    assert nav_status.status == NavStatusType.RUNNING
     assert nav_status.error_code == 1
     assert nav_status.error_desc == "Navigation is running"
 
@@ -167,147 +104,117 @@ def test_nav_status_structure():
     print()
 
 
-def test_nav_status_scenarios():
-    """Test different navigation status scenarios"""
-    print("=== Testing Navigation Status Scenarios ===")
-    print()
+@pytest.fixture(scope="module")
+def nav_status(magicbot):
+    """Shared NavStatus instance; every scenario assigns all four fields"""
+    return magicbot.NavStatus()
 
-    scenarios = [
-        {
-            "name": "Navigation Start",
-            "id": 1,
-            "status": magicbot.NavStatusType.RUNNING,
-            "error_code": 1,
-            "error_desc": "Navigation started to target point 1",
-        },
-        {
-            "name": "Navigation Success",
-            "id": 1,
-            "status": magicbot.NavStatusType.END_SUCCESS,
-            "error_code": 0,
-            "error_desc": "Successfully reached target point 1",
-        },
-        {
-            "name": "Navigation Failed",
-            "id": 2,
-            "status": magicbot.NavStatusType.END_FAILED,
-            "error_code": 1,
-            "error_desc": "Failed to reach target point 2: obstacle detected",
-        },
-        {
-            "name": "Navigation Paused",
-            "id": 3,
-            "status": magicbot.NavStatusType.PAUSE,
-            "error_code": 1,
-            "error_desc": "Navigation paused by user command",
-        },
-        {
-            "name": "Navigation Resumed",
-            "id": 3,
-            "status": magicbot.NavStatusType.CONTINUE,
-            "error_code": 1,
-            "error_desc": "Navigation resumed from pause",
-        },
-        {
-            "name": "Navigation Cancelled",
-            "id": -1,
-            "status": magicbot.NavStatusType.CANCEL,
-            "error_code": 1,
-            "error_desc": "Navigation cancelled by user",
-        },
-        {
-            "name": "No Target",
-            "id": -1,
-            "status": magicbot.NavStatusType.NONE,
-            "error_code": 1,
-            "error_desc": "No navigation target set",
-        },
-    ]
-
-    for i, scenario in enumerate(scenarios):
-        print(f"Scenario {i+1}: {scenario['name']}")
 
-        nav_status = magicbot.NavStatus()
-        nav_status.id = scenario["id"]
-        nav_status.status = scenario["status"]
-        nav_status.error_code = scenario["error_code"]
-        nav_status.error_desc = scenario["error_desc"]
+def _resolve_scenarios(magicbot):
+    """Map each scenario name to its fields with the NavStatusType member resolved"""
+    NavStatusType = magicbot.NavStatusType
+    return {
+        name: (id_, getattr(NavStatusType, status_name), error_code, error_desc)
+        for name, id_, status_name, error_code, error_desc in _NAV_SCENARIOS
+    }
+
+
+@pytest.fixture(scope="module")
+def nav_scenarios(magicbot):
+    """Scenarios resolved once per module instead of once per test"""
+    return _resolve_scenarios(magicbot)
 
+
+@pytest.mark.parametrize("name", [scenario[0] for scenario in _NAV_SCENARIOS])
+def test_nav_status_scenario(nav_status, nav_scenarios, name):
+    """Test a navigation status scenario"""
+    id_, status, error_code, error_desc = nav_scenarios[name]
+    nav_status.id = id_
+    nav_status.status = status
+    nav_status.error_code = error_code
+    nav_status.error_desc = error_desc
+
+    if VERBOSE:
+        print(f"Scenario: {name}")
         print(f"  ID: {nav_status.id}")
         print(f"  Status: {nav_status.status}")
         print(f"  Error code: {nav_status.error_code}")
         print(f"  Error description: '{nav_status.error_desc}'")
-
-        # Verify values
-        assert nav_status.id == scenario["id"]
-        assert nav_status.status == scenario["status"]
-        assert nav_status.error_code == scenario["error_code"]
-        assert nav_status.error_desc == scenario["error_desc"]
-
-        print("  ✅ Scenario verified")
         print()
 
+    # Verify values
+    assert nav_status.id == id_
+    assert nav_status.status == status
+    assert nav_status.error_code == error_code
+    assert nav_status.error_desc == error_desc
+
 
-def test_nav_status_comparison():
+def test_nav_status_comparison(magicbot):
     """Test comparison operations with NavStatusType"""
     print("=== Testing NavStatusType Comparison ===")
     print()
 
+    NavStatusType = magicbot.NavStatusType
     nav_status = magicbot.NavStatus()
 
     # Test equality comparisons
     print("Testing equality comparisons:")
-    nav_status.status = magicbot.NavStatusType.RUNNING
-    print(f"  status == RUNNING: {nav_status.status == magicbot.NavStatusType.RUNNING}")
-    assert nav_status.status == magicbot.NavStatusType.RUNNING
+    nav_status.status = NavStatusType.RUNNING
+    status = nav_status.status
+    print(f"  status == RUNNING: {status == NavStatusType.RUNNING}")
+    assert status == NavStatusType.RUNNING
 
-    nav_status.status = magicbot.NavStatusType.END_SUCCESS
-    print(
-        f"  status == END_SUCCESS: {nav_status.status == magicbot.NavStatusType.END_SUCCESS}"
-    )
-    assert nav_status.status == magicbot.NavStatusType.END_SUCCESS
+    nav_status.status = NavStatusType.END_SUCCESS
+    status = nav_status.status
+    print(f"  status == END_SUCCESS: {status == NavStatusType.END_SUCCESS}")
+    assert status == NavStatusType.END_SUCCESS
 
     # Test inequality comparisons
     print("Testing inequality comparisons:")
-    nav_status.status = magicbot.NavStatusType.RUNNING
-    print(f"  status != NONE: {nav_status.status != magicbot.NavStatusType.NONE}")
-    assert nav_status.status != magicbot.NavStatusType.NONE
+    nav_status.status = NavStatusType.RUNNING
+    status = nav_status.status
+    print(f"  status != NONE: {status != NavStatusType.NONE}")
+    assert status != NavStatusType.NONE
 
     print("✅ Comparison tests passed")
     print()
 
 
-def test_nav_status_usage_patterns():
+def test_nav_status_usage_patterns(magicbot):
     """Test common usage patterns for NavStatus"""
     print("=== Testing NavStatus Usage Patterns ===")
     print()
 
+    NavStatusType = magicbot.NavStatusType
+
+    # The patterns below assign every field they read, so they share one instance
+    nav_status = magicbot.NavStatus()
+
     # Pattern 1: Status checking
     print("Pattern 1: Status checking")
-    nav_status = magicbot.NavStatus()
-    nav_status.status = magicbot.NavStatusType.RUNNING
+    nav_status.status = NavStatusType.RUNNING
 
-    if nav_status.status == magicbot.NavStatusType.RUNNING:
+    status = nav_status.status
+    if status == NavStatusType.RUNNING:
         print("  ✅ Navigation is running")
-    elif nav_status.status == magicbot.NavStatusType.END_SUCCESS:
+    elif status == NavStatusType.END_SUCCESS:
         print("  ✅ Navigation completed successfully")
-    elif nav_status.status == magicbot.NavStatusType.END_FAILED:
+    elif status == NavStatusType.END_FAILED:
         print("  ❌ Navigation failed")
 
     print()
 
     # Pattern 2: Status transitions
     print("Pattern 2: Status transitions")
-    nav_status = magicbot.NavStatus()
     nav_status.id = 1
-    nav_status.status = magicbot.NavStatusType.RUNNING
+    nav_status.status = NavStatusType.RUNNING
     nav_status.error_code = 1
     nav_status.error_desc = "Starting navigation"
 
     print(f"  Initial: {nav_status.status}")
 
     # Simulate navigation completion
-    nav_status.status = magicbot.NavStatusType.END_SUCCESS
+    nav_status.status = NavStatusType.END_SUCCESS
     nav_status.error_code = 0
     nav_status.error_desc = "Navigation completed successfully"
     print(f"  Final: {nav_status.status}")
@@ -316,13 +223,12 @@ def test_nav_status_usage_patterns():
 
     # Pattern 3: Error handling
     print("Pattern 3: Error handling")
-    nav_status = magicbot.NavStatus()
     nav_status.id = 2
-    nav_status.status = magicbot.NavStatusType.END_FAILED
+    nav_status.status = NavStatusType.END_FAILED
     nav_status.error_code = 1
     nav_status.error_desc = "Navigation failed: obstacle detected"
 
-    if nav_status.status == magicbot.NavStatusType.END_FAILED:
+    if nav_status.status == NavStatusType.END_FAILED:
         print(f"  Error code: {nav_status.error_code}")
         print(f"  Error description: '{nav_status.error_desc}'")
         print(f"  Target ID: {nav_status.id}")
@@ -332,6 +238,8 @@ def test_nav_status_usage_patterns():
 
 def main():
     """Main test function"""
+    magicbot = get_magicbot()
+
     try:
         print("Starting NavStatus and NavStatusType Test...")
         print("=" * 60)
@@ -342,11 +250,17 @@ def main():
         print("- Common usage patterns and scenarios")
         print()
 
-        test_nav_status_type_enum()
-        test_nav_status_structure()
-        test_nav_status_scenarios()
-        test_nav_status_comparison()
-        test_nav_status_usage_patterns()
+        test_nav_status_type_enum(magicbot)
+        test_nav_status_structure(magicbot)
+        print("=== Testing Navigation Status Scenarios ===")
+        nav_status = magicbot.NavStatus()
+        nav_scenarios = _resolve_scenarios(magicbot)
+        for name in nav_scenarios:
+            test_nav_status_scenario(nav_status, nav_scenarios, name)
+        print(f"✅ {len(_NAV_SCENARIOS)} scenarios verified")
+        print()
+        test_nav_status_comparison(magicbot)
+        test_nav_status_usage_patterns(magicbot)
 
         print("=" * 60)
         print("🎉 NavStatus and NavStatusType test completed!")
@@ -6,252 +6,123 @@ Tests all fields of the PointField struct for read/write operations
 
 import sys
 import os
+from _pytest_compat import pytest
+from _import_helper import get_magicbot
+from _pointcloud import XYZI_FIELDS, make_fields
+
+# Field values are only printed when MAGICBOT_TEST_VERBOSE=1
+VERBOSE = os.environ.get("MAGICBOT_TEST_VERBOSE") == "1"
+
+# Values written to and read back from each PointField field
+_COMMON_NAMES = (
+    "x",
+    "y",
+    "z",
+    "intensity",
+    "rgb",
+    "normal_x",
+    "normal_y",
+    "normal_z",
+    "curvature",
+)
+_LONG_NAME = "very_long_field_name_that_might_be_used_for_descriptive_purposes"
+_NAMES = _COMMON_NAMES + ("", _LONG_NAME)
+
+_COMMON_OFFSETS = (0, 4, 8, 12, 16, 20, 24, 28, 32)
+_LARGE_OFFSETS = (1000, 10000, 100000, 2147483647)  # Max int32
+_OFFSETS = _COMMON_OFFSETS + _LARGE_OFFSETS
+
+# (datatype, label); 1-8 correspond to ROS2 sensor_msgs::msg::PointField constants
+_DATA_TYPES = (
+    (1, "INT8"),
+    (2, "UINT8"),
+    (3, "INT16"),
+    (4, "UINT16"),
+    (5, "INT32"),
+    (6, "UINT32"),
+    (7, "FLOAT32"),
+    (8, "FLOAT64"),
+    (0, "ZERO"),
+    (-1, "NEGATIVE"),
+)
 
-# Add the parent directory to the path to import magicbot_z1_python
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_COMMON_COUNTS = (1, 2, 3, 4, 8, 16, 32, 64)
+_LARGE_COUNTS = (100, 1000, 10000, 2147483647)  # Max int32
+_COUNTS = (0,) + _COMMON_COUNTS + _LARGE_COUNTS
+
+
+# (name, offset, datatype, count) layout used by the field combination test
+# alongside the shared XYZI_FIELDS
+_XYZ_RGB_NORMAL_FIELDS = (
+    ("x", 0, 7, 1),
+    ("y", 4, 7, 1),
+    ("z", 8, 7, 1),
+    ("rgb", 12, 6, 1),
+    ("normal_x", 16, 7, 1),
+    ("normal_y", 20, 7, 1),
+    ("normal_z", 24, 7, 1),
+    ("curvature", 28, 7, 1),
 )
 
-try:
-    import magicbot_z1_python as magicbot
-except ImportError as e:
-    print(f"Error importing magicbot_z1_python: {e}")
-    print("\n🔧 Troubleshooting steps:")
-    print("1. Make sure the SDK is built:")
-    print("   cd /path/to/magicbot_z1_sdk")
-    print("   chmod +x build.sh")
-    print("   ./build.sh")
-    print("\n2. If the module is built but not installed, you may need to:")
-    print("   - Add the build directory to PYTHONPATH")
-    print("   - Or install the module to your Python environment")
-    print("\n3. Check if the module exists in the build directory:")
-    print("   find . -name '*magicbot*' -type f")
-    print("\n4. If you're in a development environment, you might need to:")
-    print("   export PYTHONPATH=/path/to/magicbot_z1_sdk/build:$PYTHONPATH")
-    print(
-        "\n📝 For now, this test will show the expected structure without running actual tests."
-    )
-
-    # Create a mock module for demonstration
-    class MockMagicbot:
-        class PointField:
-            def __init__(self):
-                self.name = ""
-                self.offset = 0
-                self.datatype = 0
-                self.count = 0
-
-    magicbot = MockMagicbot()
-    print("\n✅ Using mock module for demonstration purposes.")
-    print("   (Replace with actual module when available)")
-
-
-def test_pointfield_name():
-    """Test PointField name field"""
-    print("=== Testing PointField Name ===")
+# Printed form of a _field_tuple()
+_FIELD_FORMAT = "name=%r, offset=%d, datatype=%d, count=%d"
 
-    point_field = magicbot.PointField()
 
-    # Test initial state
-    print("   Testing initial name:")
-    assert (
-        point_field.name == ""
-    ), f"Initial name should be empty string, got '{point_field.name}'"
-    print("     ✓ Initial name test passed")
-
-    # Test common field names
-    print("   Testing common field names:")
-    common_names = [
-        "x",
-        "y",
-        "z",
-        "intensity",
-        "rgb",
-        "normal_x",
-        "normal_y",
-        "normal_z",
-        "curvature",
-    ]
-
-    for name in common_names:
-        point_field.name = name
-        print(f"     Set name: '{name}'")
-        print(f"     Get name: '{point_field.name}'")
-        assert (
-            point_field.name == name
-        ), f"Name mismatch: expected '{name}', got '{point_field.name}'"
-        print(f"     ✓ Name '{name}' test passed")
-
-    # Test empty string
-    point_field.name = ""
-    print(f"     Set empty name: '{point_field.name}'")
-    assert (
-        point_field.name == ""
-    ), f"Empty name should be empty string, got '{point_field.name}'"
-    print("     ✓ Empty name test passed")
-
-    # Test long field name
-    long_name = "very_long_field_name_that_might_be_used_for_descriptive_purposes"
-    point_field.name = long_name
-    print(f"     Set long name: '{point_field.name}'")
-    assert (
-        point_field.name == long_name
-    ), f"Long name should be '{long_name}', got '{point_field.name}'"
-    print("     ✓ Long name test passed")
-
-    return True
+def _field_tuple(field):
+    """Read a PointField as a (name, offset, datatype, count) tuple"""
+    return (field.name, field.offset, field.datatype, field.count)
 
 
-def test_pointfield_offset():
-    """Test PointField offset field"""
-    print("\n=== Testing PointField Offset ===")
+@pytest.fixture(scope="module")
+def point_field(magicbot):
+    """One PointField shared by the value tests; each case sets what it checks"""
+    return magicbot.PointField()
 
-    point_field = magicbot.PointField()
 
-    # Test initial state
-    print("   Testing initial offset:")
-    assert (
-        point_field.offset == 0
-    ), f"Initial offset should be 0, got {point_field.offset}"
-    print("     ✓ Initial offset test passed")
-
-    # Test common offset values
-    print("   Testing common offset values:")
-    common_offsets = [0, 4, 8, 12, 16, 20, 24, 28, 32]
-
-    for offset in common_offsets:
-        point_field.offset = offset
-        print(f"     Set offset: {offset}")
-        print(f"     Get offset: {point_field.offset}")
-        assert (
-            point_field.offset == offset
-        ), f"Offset mismatch: expected {offset}, got {point_field.offset}"
-        print(f"     ✓ Offset {offset} test passed")
-
-    # Test zero offset
-    point_field.offset = 0
-    print(f"     Set zero offset: {point_field.offset}")
-    assert point_field.offset == 0, f"Zero offset should be 0, got {point_field.offset}"
-    print("     ✓ Zero offset test passed")
-
-    # Test large offset values
-    print("   Testing large offset values:")
-    large_offsets = [1000, 10000, 100000, 2147483647]  # Max int32
-
-    for offset in large_offsets:
-        point_field.offset = offset
-        print(f"     Set large offset: {offset}")
-        assert (
-            point_field.offset == offset
-        ), f"Large offset should be {offset}, got {point_field.offset}"
-        print(f"     ✓ Large offset {offset} test passed")
+def test_pointfield_initial_values(magicbot):
+    """Test the default-constructed PointField fields"""
+    print("=== Testing PointField Initial Values ===")
 
+    point_field = magicbot.PointField()
+    got = _field_tuple(point_field)
+    assert got == ("", 0, 0, 0), f"Initial values should be ('', 0, 0, 0), got {got}"
+    print("   ✓ Initial values test passed")
     return True
 
 
-def test_pointfield_datatype():
-    """Test PointField datatype field"""
-    print("\n=== Testing PointField DataType ===")
-
-    point_field = magicbot.PointField()
-
-    # Test initial state
-    print("   Testing initial datatype:")
-    assert (
-        point_field.datatype == 0
-    ), f"Initial datatype should be 0, got {point_field.datatype}"
-    print("     ✓ Initial datatype test passed")
-
-    # Test common data types (based on ROS2 sensor_msgs::msg::PointField constants)
-    print("   Testing common data types:")
-    # These values correspond to ROS2 PointField constants
-    data_types = {
-        1: "INT8",
-        2: "UINT8",
-        3: "INT16",
-        4: "UINT16",
-        5: "INT32",
-        6: "UINT32",
-        7: "FLOAT32",
-        8: "FLOAT64",
-    }
-
-    for datatype, type_name in data_types.items():
-        point_field.datatype = datatype
-        print(f"     Set datatype: {datatype} ({type_name})")
-        print(f"     Get datatype: {point_field.datatype}")
-        assert (
-            point_field.datatype == datatype
-        ), f"Datatype mismatch: expected {datatype}, got {point_field.datatype}"
-        print(f"     ✓ Datatype {datatype} ({type_name}) test passed")
-
-    # Test zero datatype
-    point_field.datatype = 0
-    print(f"     Set zero datatype: {point_field.datatype}")
-    assert (
-        point_field.datatype == 0
-    ), f"Zero datatype should be 0, got {point_field.datatype}"
-    print("     ✓ Zero datatype test passed")
-
-    # Test negative datatype (edge case)
-    print("   Testing negative datatype:")
-    negative_datatype = -1
-    point_field.datatype = negative_datatype
-    print(f"     Set negative datatype: {point_field.datatype}")
-    assert (
-        point_field.datatype == negative_datatype
-    ), f"Negative datatype should be {negative_datatype}, got {point_field.datatype}"
-    print("     ✓ Negative datatype test passed")
+@pytest.mark.parametrize("name", _NAMES)
+def test_pointfield_name(point_field, name):
+    """Test PointField name field"""
+    point_field.name = name
+    assert point_field.name == name
 
-    return True
 
+@pytest.mark.parametrize("offset", _OFFSETS)
+def test_pointfield_offset(point_field, offset):
+    """Test PointField offset field"""
+    point_field.offset = offset
+    assert point_field.offset == offset
 
-def test_pointfield_count():
-    """Test PointField count field"""
-    print("\n=== Testing PointField Count ===")
 
-    point_field = magicbot.PointField()
+@pytest.mark.parametrize(
+    "datatype",
+    [datatype for datatype, _ in _DATA_TYPES],
+    ids=[name for _, name in _DATA_TYPES],
+)
+def test_pointfield_datatype(point_field, datatype):
+    """Test PointField datatype field"""
+    point_field.datatype = datatype
+    assert point_field.datatype == datatype
 
-    # Test initial state
-    print("   Testing initial count:")
-    assert point_field.count == 0, f"Initial count should be 0, got {point_field.count}"
-    print("     ✓ Initial count test passed")
-
-    # Test common count values
-    print("   Testing common count values:")
-    common_counts = [1, 2, 3, 4, 8, 16, 32, 64]
-
-    for count in common_counts:
-        point_field.count = count
-        print(f"     Set count: {count}")
-        print(f"     Get count: {point_field.count}")
-        assert (
-            point_field.count == count
-        ), f"Count mismatch: expected {count}, got {point_field.count}"
-        print(f"     ✓ Count {count} test passed")
-
-    # Test zero count
-    point_field.count = 0
-    print(f"     Set zero count: {point_field.count}")
-    assert point_field.count == 0, f"Zero count should be 0, got {point_field.count}"
-    print("     ✓ Zero count test passed")
-
-    # Test large count values
-    print("   Testing large count values:")
-    large_counts = [100, 1000, 10000, 2147483647]  # Max int32
-
-    for count in large_counts:
-        point_field.count = count
-        print(f"     Set large count: {count}")
-        assert (
-            point_field.count == count
-        ), f"Large count should be {count}, got {point_field.count}"
-        print(f"     ✓ Large count {count} test passed")
 
-    return True
+@pytest.mark.parametrize("count", _COUNTS)
+def test_pointfield_count(point_field, count):
+    """Test PointField count field"""
+    point_field.count = count
+    assert point_field.count == count
 
 
-def test_pointfield_comprehensive():
+def test_pointfield_comprehensive(magicbot):
     """Test comprehensive PointField data"""
     print("\n=== Testing Comprehensive PointField Data ===")
 
@@ -263,152 +134,124 @@ def test_pointfield_comprehensive():
     point_field.datatype = 7  # FLOAT32
     point_field.count = 1
 
-    print("   Setting comprehensive point field data:")
-    print(f"     Name: '{point_field.name}'")
-    print(f"     Offset: {point_field.offset}")
-    print(f"     DataType: {point_field.datatype}")
-    print(f"     Count: {point_field.count}")
+    if VERBOSE:
+        print("   Setting comprehensive point field data:")
+        print(f"     Name: '{point_field.name}'")
+        print(f"     Offset: {point_field.offset}")
+        print(f"     DataType: {point_field.datatype}")
+        print(f"     Count: {point_field.count}")
 
     # Verify all fields
-    assert point_field.name == "intensity"
-    assert point_field.offset == 12
-    assert point_field.datatype == 7
-    assert point_field.count == 1
+    assert _field_tuple(point_field) == ("intensity", 12, 7, 1)
 
     print("   ✓ Comprehensive test passed")
     return True
 
 
-def test_pointfield_typical_scenarios():
+def test_pointfield_typical_scenarios(magicbot):
     """Test PointField with typical point cloud scenarios"""
     print("\n=== Testing PointField Typical Scenarios ===")
 
+    # Bound once so the constructor calls below skip the module attribute lookup
+    PointField = magicbot.PointField
+
     # Test scenario 1: XYZ coordinates
     print("   Testing XYZ coordinates scenario:")
-    xyz_field = magicbot.PointField()
+    xyz_field = PointField()
     xyz_field.name = "x"
     xyz_field.offset = 0
     xyz_field.datatype = 7  # FLOAT32
     xyz_field.count = 1
 
-    print(
-        f"     X field: name='{xyz_field.name}', offset={xyz_field.offset}, datatype={xyz_field.datatype}, count={xyz_field.count}"
-    )
-    assert (
-        xyz_field.name == "x"
-        and xyz_field.offset == 0
-        and xyz_field.datatype == 7
-        and xyz_field.count == 1
-    )
+    got = _field_tuple(xyz_field)
+    if VERBOSE:
+        print("     X field: " + _FIELD_FORMAT % got)
+    assert got == ("x", 0, 7, 1)
     print("     ✓ X field test passed")
 
-    y_field = magicbot.PointField()
+    y_field = PointField()
     y_field.name = "y"
     y_field.offset = 4
     y_field.datatype = 7  # FLOAT32
     y_field.count = 1
 
-    print(
-        f"     Y field: name='{y_field.name}', offset={y_field.offset}, datatype={y_field.datatype}, count={y_field.count}"
-    )
-    assert (
-        y_field.name == "y"
-        and y_field.offset == 4
-        and y_field.datatype == 7
-        and y_field.count == 1
-    )
+    got = _field_tuple(y_field)
+    if VERBOSE:
+        print("     Y field: " + _FIELD_FORMAT % got)
+    assert got == ("y", 4, 7, 1)
     print("     ✓ Y field test passed")
 
-    z_field = magicbot.PointField()
+    z_field = PointField()
     z_field.name = "z"
     z_field.offset = 8
     z_field.datatype = 7  # FLOAT32
     z_field.count = 1
 
-    print(
-        f"     Z field: name='{z_field.name}', offset={z_field.offset}, datatype={z_field.datatype}, count={z_field.count}"
-    )
-    assert (
-        z_field.name == "z"
-        and z_field.offset == 8
-        and z_field.datatype == 7
-        and z_field.count == 1
-    )
+    got = _field_tuple(z_field)
+    if VERBOSE:
+        print("     Z field: " + _FIELD_FORMAT % got)
+    assert got == ("z", 8, 7, 1)
     print("     ✓ Z field test passed")
 
     # Test scenario 2: RGB color
     print("   Testing RGB color scenario:")
-    rgb_field = magicbot.PointField()
+    rgb_field = PointField()
     rgb_field.name = "rgb"
     rgb_field.offset = 12
     rgb_field.datatype = 6  # UINT32
     rgb_field.count = 1
 
-    print(
-        f"     RGB field: name='{rgb_field.name}', offset={rgb_field.offset}, datatype={rgb_field.datatype}, count={rgb_field.count}"
-    )
-    assert (
-        rgb_field.name == "rgb"
-        and rgb_field.offset == 12
-        and rgb_field.datatype == 6
-        and rgb_field.count == 1
-    )
+    got = _field_tuple(rgb_field)
+    if VERBOSE:
+        print("     RGB field: " + _FIELD_FORMAT % got)
+    assert got == ("rgb", 12, 6, 1)
     print("     ✓ RGB field test passed")
 
     # Test scenario 3: Intensity
     print("   Testing intensity scenario:")
-    intensity_field = magicbot.PointField()
+    intensity_field = PointField()
     intensity_field.name = "intensity"
     intensity_field.offset = 16
     intensity_field.datatype = 7  # FLOAT32
     intensity_field.count = 1
 
-    print(
-        f"     Intensity field: name='{intensity_field.name}', offset={intensity_field.offset}, datatype={intensity_field.datatype}, count={intensity_field.count}"
-    )
-    assert (
-        intensity_field.name == "intensity"
-        and intensity_field.offset == 16
-        and intensity_field.datatype == 7
-        and intensity_field.count == 1
-    )
+    got = _field_tuple(intensity_field)
+    if VERBOSE:
+        print("     Intensity field: " + _FIELD_FORMAT % got)
+    assert got == ("intensity", 16, 7, 1)
     print("     ✓ Intensity field test passed")
 
     # Test scenario 4: Normal vectors
     print("   Testing normal vectors scenario:")
-    normal_x_field = magicbot.PointField()
+    normal_x_field = PointField()
     normal_x_field.name = "normal_x"
     normal_x_field.offset = 20
     normal_x_field.datatype = 7  # FLOAT32
     normal_x_field.count = 1
 
-    normal_y_field = magicbot.PointField()
+    normal_y_field = PointField()
     normal_y_field.name = "normal_y"
     normal_y_field.offset = 24
     normal_y_field.datatype = 7  # FLOAT32
     normal_y_field.count = 1
 
-    normal_z_field = magicbot.PointField()
+    normal_z_field = PointField()
     normal_z_field.name = "normal_z"
     normal_z_field.offset = 28
     normal_z_field.datatype = 7  # FLOAT32
     normal_z_field.count = 1
 
-    print(
-        f"     Normal X field: name='{normal_x_field.name}', offset={normal_x_field.offset}, datatype={normal_x_field.datatype}, count={normal_x_field.count}"
-    )
-    print(
-        f"     Normal Y field: name='{normal_y_field.name}', offset={normal_y_field.offset}, datatype={normal_y_field.datatype}, count={normal_y_field.count}"
-    )
-    print(
-        f"     Normal Z field: name='{normal_z_field.name}', offset={normal_z_field.offset}, datatype={normal_z_field.datatype}, count={normal_z_field.count}"
-    )
+    if VERBOSE:
+        print("     Normal X field: " + _FIELD_FORMAT % _field_tuple(normal_x_field))
+        print("     Normal Y field: " + _FIELD_FORMAT % _field_tuple(normal_y_field))
+        print("     Normal Z field: " + _FIELD_FORMAT % _field_tuple(normal_z_field))
     print("     ✓ Normal fields test passed")
 
     return True
 
 
-def test_pointfield_edge_cases():
+@pytest.mark.slow
+def test_pointfield_edge_cases(magicbot):
     """Test PointField edge cases"""
     print("\n=== Testing PointField Edge Cases ===")
 
@@ -418,7 +261,8 @@ def test_pointfield_edge_cases():
     print("   Testing very long field name:")
     very_long_name = "very_long_field_name_that_might_be_used_for_descriptive_purposes_in_complex_point_cloud_applications"
     point_field.name = very_long_name
-    print(f"     Set very long name: '{point_field.name}'")
+    if VERBOSE:
+        print(f"     Set very long name: '{point_field.name}'")
     assert (
         point_field.name == very_long_name
     ), f"Very long name should be '{very_long_name}', got '{point_field.name}'"
@@ -428,7 +272,8 @@ def test_pointfield_edge_cases():
     print("   Testing maximum offset value:")
     max_offset = 2147483647  # Max int32
     point_field.offset = max_offset
-    print(f"     Set max offset: {point_field.offset}")
+    if VERBOSE:
+        print(f"     Set max offset: {point_field.offset}")
     assert (
         point_field.offset == max_offset
     ), f"Max offset should be {max_offset}, got {point_field.offset}"
@@ -438,7 +283,8 @@ def test_pointfield_edge_cases():
     print("   Testing maximum datatype value:")
     max_datatype = 127  # Max int8
     point_field.datatype = max_datatype
-    print(f"     Set max datatype: {point_field.datatype}")
+    if VERBOSE:
+        print(f"     Set max datatype: {point_field.datatype}")
     assert (
         point_field.datatype == max_datatype
     ), f"Max datatype should be {max_datatype}, got {point_field.datatype}"
@@ -448,7 +294,8 @@ def test_pointfield_edge_cases():
     print("   Testing maximum count value:")
     max_count = 2147483647  # Max int32
     point_field.count = max_count
-    print(f"     Set max count: {point_field.count}")
+    if VERBOSE:
+        print(f"     Set max count: {point_field.count}")
     assert (
         point_field.count == max_count
     ), f"Max count should be {max_count}, got {point_field.count}"
@@ -459,9 +306,10 @@ def test_pointfield_edge_cases():
     point_field.offset = -100
     point_field.datatype = -50
     point_field.count = -10
-    print(f"     Set negative offset: {point_field.offset}")
-    print(f"     Set negative datatype: {point_field.datatype}")
-    print(f"     Set negative count: {point_field.count}")
+    if VERBOSE:
+        print(f"     Set negative offset: {point_field.offset}")
+        print(f"     Set negative datatype: {point_field.datatype}")
+        print(f"     Set negative count: {point_field.count}")
     assert (
         point_field.offset == -100
     ), f"Negative offset should be -100, got {point_field.offset}"
@@ -477,7 +325,8 @@ def test_pointfield_edge_cases():
     print("   Testing special characters in name:")
     special_name = "field_with_underscores_and_numbers_123"
     point_field.name = special_name
-    print(f"     Set special name: '{point_field.name}'")
+    if VERBOSE:
+        print(f"     Set special name: '{point_field.name}'")
     assert (
         point_field.name == special_name
     ), f"Special name should be '{special_name}', got '{point_field.name}'"
@@ -487,113 +336,36 @@ def test_pointfield_edge_cases():
     return True
 
 
-def test_pointfield_field_combinations():
+def test_pointfield_field_combinations(magicbot):
     """Test PointField with different field combinations"""
     print("\n=== Testing PointField Field Combinations ===")
 
     # Test combination 1: Basic XYZ + Intensity
     print("   Testing XYZ + Intensity combination:")
-    fields = []
-
-    # X field
-    x_field = magicbot.PointField()
-    x_field.name = "x"
-    x_field.offset = 0
-    x_field.datatype = 7  # FLOAT32
-    x_field.count = 1
-    fields.append(x_field)
-
-    # Y field
-    y_field = magicbot.PointField()
-    y_field.name = "y"
-    y_field.offset = 4
-    y_field.datatype = 7  # FLOAT32
-    y_field.count = 1
-    fields.append(y_field)
-
-    # Z field
-    z_field = magicbot.PointField()
-    z_field.name = "z"
-    z_field.offset = 8
-    z_field.datatype = 7  # FLOAT32
-    z_field.count = 1
-    fields.append(z_field)
-
-    # Intensity field
-    intensity_field = magicbot.PointField()
-    intensity_field.name = "intensity"
-    intensity_field.offset = 12
-    intensity_field.datatype = 7  # FLOAT32
-    intensity_field.count = 1
-    fields.append(intensity_field)
+    fields = make_fields(magicbot, XYZI_FIELDS)
 
     # Verify all fields
-    expected_names = ["x", "y", "z", "intensity"]
-    expected_offsets = [0, 4, 8, 12]
-    expected_datatypes = [7, 7, 7, 7]
-    expected_counts = [1, 1, 1, 1]
-
-    for i, field in enumerate(fields):
-        print(
-            f"     Field {i}: name='{field.name}', offset={field.offset}, datatype={field.datatype}, count={field.count}"
-        )
-        assert (
-            field.name == expected_names[i]
-        ), f"Field {i} name should be '{expected_names[i]}', got '{field.name}'"
-        assert (
-            field.offset == expected_offsets[i]
-        ), f"Field {i} offset should be {expected_offsets[i]}, got {field.offset}"
-        assert (
-            field.datatype == expected_datatypes[i]
-        ), f"Field {i} datatype should be {expected_datatypes[i]}, got {field.datatype}"
-        assert (
-            field.count == expected_counts[i]
-        ), f"Field {i} count should be {expected_counts[i]}, got {field.count}"
+    got = tuple(_field_tuple(field) for field in fields)
+    if VERBOSE:
+        for i, values in enumerate(got):
+            print(f"     Field {i}: " + _FIELD_FORMAT % values)
+    assert got == XYZI_FIELDS, f"Fields should be {XYZI_FIELDS}, got {got}"
 
     print("     ✓ XYZ + Intensity combination test passed")
 
     # Test combination 2: XYZ + RGB + Normals
     print("   Testing XYZ + RGB + Normals combination:")
-    complex_fields = []
-
     # Create a more complex field set
-    field_configs = [
-        ("x", 0, 7, 1),
-        ("y", 4, 7, 1),
-        ("z", 8, 7, 1),
-        ("rgb", 12, 6, 1),
-        ("normal_x", 16, 7, 1),
-        ("normal_y", 20, 7, 1),
-        ("normal_z", 24, 7, 1),
-        ("curvature", 28, 7, 1),
-    ]
-
-    for name, offset, datatype, count in field_configs:
-        field = magicbot.PointField()
-        field.name = name
-        field.offset = offset
-        field.datatype = datatype
-        field.count = count
-        complex_fields.append(field)
+    complex_fields = make_fields(magicbot, _XYZ_RGB_NORMAL_FIELDS)
 
     # Verify complex field set
-    for i, (name, offset, datatype, count) in enumerate(field_configs):
-        field = complex_fields[i]
-        print(
-            f"     Complex field {i}: name='{field.name}', offset={field.offset}, datatype={field.datatype}, count={field.count}"
-        )
-        assert (
-            field.name == name
-        ), f"Complex field {i} name should be '{name}', got '{field.name}'"
-        assert (
-            field.offset == offset
-        ), f"Complex field {i} offset should be {offset}, got {field.offset}"
-        assert (
-            field.datatype == datatype
-        ), f"Complex field {i} datatype should be {datatype}, got {field.datatype}"
-        assert (
-            field.count == count
-        ), f"Complex field {i} count should be {count}, got {field.count}"
+    got = tuple(_field_tuple(field) for field in complex_fields)
+    if VERBOSE:
+        for i, values in enumerate(got):
+            print(f"     Complex field {i}: " + _FIELD_FORMAT % values)
+    assert (
+        got == _XYZ_RGB_NORMAL_FIELDS
+    ), f"Complex fields should be {_XYZ_RGB_NORMAL_FIELDS}, got {got}"
 
     print("     ✓ XYZ + RGB + Normals combination test passed")
 
@@ -602,18 +374,30 @@ def test_pointfield_field_combinations():
 
 def main():
     """Main test function"""
+    magicbot = get_magicbot()
+
     try:
         print("Starting PointField binding tests...")
         print("=" * 50)
 
-        test_pointfield_name()
-        test_pointfield_offset()
-        test_pointfield_datatype()
-        test_pointfield_count()
-        test_pointfield_comprehensive()
-        test_pointfield_typical_scenarios()
-        test_pointfield_edge_cases()
-        test_pointfield_field_combinations()
+        test_pointfield_initial_values(magicbot)
+        point_field = magicbot.PointField()
+        for name in _NAMES:
+            test_pointfield_name(point_field, name)
+        print(f"   ✓ {len(_NAMES)} names test passed")
+        for offset in _OFFSETS:
+            test_pointfield_offset(point_field, offset)
+        print(f"   ✓ {len(_OFFSETS)} offsets test passed")
+        for datatype, _ in _DATA_TYPES:
+            test_pointfield_datatype(point_field, datatype)
+        print(f"   ✓ {len(_DATA_TYPES)} datatypes test passed")
+        for count in _COUNTS:
+            test_pointfield_count(point_field, count)
+        print(f"   ✓ {len(_COUNTS)} counts test passed")
+        test_pointfield_comprehensive(magicbot)
+        test_pointfield_typical_scenarios(magicbot)
+        test_pointfield_edge_cases(magicbot)
+        test_pointfield_field_combinations(magicbot)
 
         print("\n" + "=" * 50)
         print("🎉 All PointField binding tests completed successfully!")
@@ -2,54 +2,27 @@
 import sys
 import os
 import math
+from functools import partial
 
-# Add the parent directory to the path to import magicbot_z1_python
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
-
-try:
-    import magicbot_z1_python as magicbot
-except ImportError as e:
-    print(f"Error importing magicbot_z1_python: {e}")
-    print("\n🔧 Troubleshooting steps:")
-    print("1. Make sure the SDK is built:")
-    print("   cd /path/to/magicbot_z1_sdk")
-    print("   chmod +x build.sh")
-    print("   ./build.sh")
-    print("\n2. If the module is built but not installed, you may need to:")
-    print("   - Add the build directory to PYTHONPATH")
-    print("   - Or install the module to your Python environment")
-    print("\n3. Check if the module exists in the build directory:")
-    print("   find . -name '*magicbot*' -type f")
-    print("\n4. If you're in a development environment, you might need to:")
-    print("   export PYTHONPATH=/path/to/magicbot_z1_sdk/build:$PYTHONPATH")
-    print(
-        "\n📝 For now, this test will show the expected structure without running actual tests."
-    )
-
-    # Create a mock module for demonstration
-    class MockMagicbot:
-        class Pose3DEuler:
-            def __init__(self):
-                self.position = [0.0, 0.0, 0.0]
-                self.orientation = [0.0, 0.0, 0.0]
+from _import_helper import get_magicbot
+from _runner import run_all
 
-        class Point2D:
-            def __init__(self):
-                self.x = 0.0
-                self.y = 0.0
+# Field values are only printed when MAGICBOT_TEST_VERBOSE=1
+VERBOSE = os.environ.get("MAGICBOT_TEST_VERBOSE") == "1"
 
-        class PolyRegion:
-            def __init__(self):
-                self.points = []
+# Pose3DEuler values written by test_pose3d_euler; the binding only accepts
+# lists for std::array fields, so these must not be tuples
+_TEST_POSITION = [1.5, 2.3, -0.8]
+_TEST_ORIENTATION = [0.1, -0.2, 1.57]  # roll, pitch, yaw in radians
+_NEW_POSITION = [3.14, -2.71, 1.41]
+_NEW_ORIENTATION = [math.pi / 4, -math.pi / 6, math.pi / 2]
 
-    magicbot = MockMagicbot()
-    print("\n✅ Using mock module for demonstration purposes.")
-    print("   (Replace with actual module when available)")
+# Vertices of a 10-point polygon on the unit circle, computed once at import
+_CIRCLE_ANGLES = tuple(2 * math.pi * i / 10 for i in range(10))
+_CIRCLE_COORDS = tuple((math.cos(a), math.sin(a)) for a in _CIRCLE_ANGLES)
 
 
-def test_pose3d_euler():
+def test_pose3d_euler(magicbot):
     """Test Pose3DEuler structure"""
     print("=== Testing Pose3DEuler ===")
 
@@ -57,59 +30,64 @@ def test_pose3d_euler():
 
     # Test initial values
     print("   Testing initial values:")
-    print(f"     position: {pose.position}")
-    print(f"     orientation: {pose.orientation}")
+    if VERBOSE:
+        print(f"     position: {pose.position}")
+        print(f"     orientation: {pose.orientation}")
 
     # Test setting position (x, y, z)
     print("   Testing setting position:")
-    test_position = [1.5, 2.3, -0.8]
-    pose.position = test_position
-    print(f"     Set position: {pose.position}")
+    pose.position = _TEST_POSITION
+    if VERBOSE:
+        print(f"     Set position: {pose.position}")
     assert len(pose.position) == 3
-    for i, pos in enumerate(pose.position):
-        assert abs(pos - test_position[i]) < 1e-6
+    assert all(
+        math.isclose(got, want, abs_tol=1e-6)
+        for got, want in zip(pose.position, _TEST_POSITION)
+    )
 
     # Test setting orientation (roll, pitch, yaw)
     print("   Testing setting orientation:")
-    test_orientation = [0.1, -0.2, 1.57]  # roll, pitch, yaw in radians
-    pose.orientation = test_orientation
-    print(f"     Set orientation: {pose.orientation}")
+    pose.orientation = _TEST_ORIENTATION
+    if VERBOSE:
+        print(f"     Set orientation: {pose.orientation}")
     assert len(pose.orientation) == 3
-    for i, ori in enumerate(pose.orientation):
-        assert abs(ori - test_orientation[i]) < 1e-6
+    assert all(
+        math.isclose(got, want, abs_tol=1e-6)
+        for got, want in zip(pose.orientation, _TEST_ORIENTATION)
+    )
 
     # Test modifying individual elements (need to reassign entire array for std::array)
     print("   Testing modifying individual elements:")
     # Note: std::array fields cannot be modified element by element in pybind11
     # We need to reassign the entire array
-    new_position = [3.14, -2.71, 1.41]
-    pose.position = new_position
-    print(f"     Modified position: {pose.position}")
-    assert abs(pose.position[0] - 3.14) < 1e-6
-    assert abs(pose.position[1] - (-2.71)) < 1e-6
-    assert abs(pose.position[2] - 1.41) < 1e-6
-
-    new_orientation = [math.pi / 4, -math.pi / 6, math.pi / 2]
-    pose.orientation = new_orientation
-    print(f"     Modified orientation: {pose.orientation}")
-    assert abs(pose.orientation[0] - math.pi / 4) < 1e-6
-    assert abs(pose.orientation[1] - (-math.pi / 6)) < 1e-6
-    assert abs(pose.orientation[2] - math.pi / 2) < 1e-6
-
-    new_position[0] = pose.position[0]
-    new_position[1] = -2.8
-    new_position[2] = pose.position[2]
+    pose.position = _NEW_POSITION
+    if VERBOSE:
+        print(f"     Modified position: {pose.position}")
+    assert all(
+        math.isclose(got, want, abs_tol=1e-6)
+        for got, want in zip(pose.position, _NEW_POSITION)
+    )
+
+    pose.orientation = _NEW_ORIENTATION
+    if VERBOSE:
+        print(f"     Modified orientation: {pose.orientation}")
+    assert all(
+        math.isclose(got, want, abs_tol=1e-6)
+        for got, want in zip(pose.orientation, _NEW_ORIENTATION)
+    )
+
     pose.position = [pose.position[0], -2.8, pose.position[2]]
-    print(f"     Modified position: {pose.position}")
-    assert abs(pose.position[0] - 3.14) < 1e-6
-    assert abs(pose.position[1] - (-2.8)) < 1e-6
-    assert abs(pose.position[2] - 1.41) < 1e-6
+    if VERBOSE:
+        print(f"     Modified position: {pose.position}")
+    assert math.isclose(pose.position[0], 3.14, abs_tol=1e-6)
+    assert math.isclose(pose.position[1], -2.8, abs_tol=1e-6)
+    assert math.isclose(pose.position[2], 1.41, abs_tol=1e-6)
 
     print("   ✓ Pose3DEuler test passed")
     return True
 
 
-def test_point2d():
+def test_point2d(magicbot):
     """Test Point2D structure"""
     print("\n=== Testing Point2D ===")
 
@@ -117,42 +95,46 @@ def test_point2d():
 
     # Test initial values
     print("   Testing initial values:")
-    print(f"     x: {point.x}")
-    print(f"     y: {point.y}")
+    if VERBOSE:
+        print(f"     x: {point.x}")
+        print(f"     y: {point.y}")
 
     # Test setting x and y coordinates
     print("   Testing setting coordinates:")
     point.x = 5.67
     point.y = -3.21
-    print(f"     Set x: {point.x}")
-    print(f"     Set y: {point.y}")
-    assert abs(point.x - 5.67) < 1e-6
-    assert abs(point.y - (-3.21)) < 1e-6
+    if VERBOSE:
+        print(f"     Set x: {point.x}")
+        print(f"     Set y: {point.y}")
+    assert math.isclose(point.x, 5.67, abs_tol=1e-6)
+    assert math.isclose(point.y, -3.21, abs_tol=1e-6)
 
     # Test setting different values
     print("   Testing setting different values:")
     point.x = 0.0
     point.y = 0.0
-    print(f"     Set to origin: x={point.x}, y={point.y}")
-    assert abs(point.x) < 1e-6
-    assert abs(point.y) < 1e-6
+    if VERBOSE:
+        print(f"     Set to origin: x={point.x}, y={point.y}")
+    assert math.isclose(point.x, 0.0, abs_tol=1e-6)
+    assert math.isclose(point.y, 0.0, abs_tol=1e-6)
 
     # Test with large values
     print("   Testing with large values:")
     point.x = 12345.6789
     point.y = -98765.4321
-    print(f"     Large values: x={point.x}, y={point.y}")
-    print(f"     Expected: x=12345.6789, y=-98765.4321")
-    print(f"     Note: Point2D uses float (32-bit), so precision is limited")
+    if VERBOSE:
+        print(f"     Large values: x={point.x}, y={point.y}")
+        print(f"     Expected: x=12345.6789, y=-98765.4321")
+        print(f"     Note: Point2D uses float (32-bit), so precision is limited")
     # Point2D uses float (32-bit), so we need to use lower precision for comparison
-    assert abs(point.x - 12345.6789) < 1e-2  # float precision is much lower
-    assert abs(point.y - (-98765.4321)) < 1e-2
+    assert math.isclose(point.x, 12345.6789, abs_tol=1e-2)
+    assert math.isclose(point.y, -98765.4321, abs_tol=1e-2)
 
     print("   ✓ Point2D test passed")
     return True
 
 
-def test_poly_region():
+def test_poly_region(magicbot):
     """Test PolyRegion structure"""
     print("\n=== Testing PolyRegion ===")
 
@@ -160,8 +142,9 @@ def test_poly_region():
 
     # Test initial values
     print("   Testing initial values:")
-    print(f"     points count: {len(poly_region.points)}")
-    print(f"     points: {poly_region.points}")
+    if VERBOSE:
+        print(f"     points count: {len(poly_region.points)}")
+        print(f"     points: {poly_region.points}")
 
     # Test adding points to create a rectangle
     print("   Testing adding points for rectangle:")
@@ -175,20 +158,22 @@ def test_poly_region():
     # Set rectangle coordinates (0,0), (10,0), (10,5), (0,5)
     rectangle_coords = [(0.0, 0.0), (10.0, 0.0), (10.0, 5.0), (0.0, 5.0)]
 
-    for i, (point, (x, y)) in enumerate(zip(rectangle_points, rectangle_coords)):
+    for point, (x, y) in zip(rectangle_points, rectangle_coords):
         point.x = x
         point.y = y
         poly_region.points.append(point)
-        print(f"     Added point {i}: ({point.x}, {point.y})")
 
-    print(f"     Total points: {len(poly_region.points)}")
+    if VERBOSE:
+        for i, point in enumerate(poly_region.points):
+            print(f"     Added point {i}: ({point.x}, {point.y})")
+        print(f"     Total points: {len(poly_region.points)}")
     assert len(poly_region.points) == 4
 
     # Verify rectangle points
     for i, point in enumerate(poly_region.points):
         expected_x, expected_y = rectangle_coords[i]
-        assert abs(point.x - expected_x) < 1e-6
-        assert abs(point.y - expected_y) < 1e-6
+        assert math.isclose(point.x, expected_x, abs_tol=1e-6)
+        assert math.isclose(point.y, expected_y, abs_tol=1e-6)
 
     # Test adding points to create a triangle
     print("   Testing adding points for triangle:")
@@ -199,26 +184,28 @@ def test_poly_region():
     # Set triangle coordinates (0,0), (5,0), (2.5,4)
     triangle_coords = [(0.0, 0.0), (5.0, 0.0), (2.5, 4.0)]
 
-    for i, (point, (x, y)) in enumerate(zip(triangle_points, triangle_coords)):
+    for point, (x, y) in zip(triangle_points, triangle_coords):
         point.x = x
         point.y = y
         poly_region.points.append(point)
-        print(f"     Added triangle point {i}: ({point.x}, {point.y})")
 
-    print(f"     Total triangle points: {len(poly_region.points)}")
+    if VERBOSE:
+        for i, point in enumerate(poly_region.points):
+            print(f"     Added triangle point {i}: ({point.x}, {point.y})")
+        print(f"     Total triangle points: {len(poly_region.points)}")
     assert len(poly_region.points) == 3
 
     # Verify triangle points
     for i, point in enumerate(poly_region.points):
         expected_x, expected_y = triangle_coords[i]
-        assert abs(point.x - expected_x) < 1e-6
-        assert abs(point.y - expected_y) < 1e-6
+        assert math.isclose(point.x, expected_x, abs_tol=1e-6)
+        assert math.isclose(point.y, expected_y, abs_tol=1e-6)
 
     print("   ✓ PolyRegion test passed")
     return True
 
 
-def test_spatial_structures_comprehensive():
+def test_spatial_structures_comprehensive(magicbot):
     """Test comprehensive spatial structures"""
     print("\n=== Testing Spatial Structures Comprehensive ===")
 
@@ -232,9 +219,6 @@ def test_spatial_structures_comprehensive():
         pose.position = [i * 2.0, i * 1.5, i * 0.5]
         pose.orientation = [i * 0.1, i * -0.1, i * 0.5]
         poses.append(pose)
-        print(
-            f"     Created pose {i}: position={pose.position}, orientation={pose.orientation}"
-        )
 
     # Create multiple points
     points = []
@@ -243,7 +227,6 @@ def test_spatial_structures_comprehensive():
         point.x = i * 1.0
         point.y = i * 0.5
         points.append(point)
-        print(f"     Created point {i}: ({point.x}, {point.y})")
 
     # Create multiple polygonal regions
     regions = []
@@ -265,7 +248,16 @@ def test_spatial_structures_comprehensive():
             poly_region.points.append(point)
 
         regions.append(poly_region)
-        print(f"     Created region {region_idx}: {len(poly_region.points)} points")
+
+    if VERBOSE:
+        for i, pose in enumerate(poses):
+            print(
+                f"     Created pose {i}: position={pose.position}, orientation={pose.orientation}"
+            )
+        for i, point in enumerate(points):
+            print(f"     Created point {i}: ({point.x}, {point.y})")
+        for i, region in enumerate(regions):
+            print(f"     Created region {i}: {len(region.points)} points")
 
     # Verify all structures
     assert len(poses) == 3
@@ -275,13 +267,13 @@ def test_spatial_structures_comprehensive():
     for i, pose in enumerate(poses):
         assert len(pose.position) == 3
         assert len(pose.orientation) == 3
-        assert abs(pose.position[0] - i * 2.0) < 1e-6
-        assert abs(pose.position[1] - i * 1.5) < 1e-6
-        assert abs(pose.position[2] - i * 0.5) < 1e-6
+        assert math.isclose(pose.position[0], i * 2.0, abs_tol=1e-6)
+        assert math.isclose(pose.position[1], i * 1.5, abs_tol=1e-6)
+        assert math.isclose(pose.position[2], i * 0.5, abs_tol=1e-6)
 
     for i, point in enumerate(points):
-        assert abs(point.x - i * 1.0) < 1e-6
-        assert abs(point.y - i * 0.5) < 1e-6
+        assert math.isclose(point.x, i * 1.0, abs_tol=1e-6)
+        assert math.isclose(point.y, i * 0.5, abs_tol=1e-6)
 
     for region in regions:
         assert len(region.points) > 0
@@ -293,7 +285,7 @@ def test_spatial_structures_comprehensive():
     return True
 
 
-def test_spatial_structures_edge_cases():
+def test_spatial_structures_edge_cases(magicbot):
     """Test edge cases for spatial structures"""
     print("\n=== Testing Spatial Structures Edge Cases ===")
 
@@ -304,16 +296,18 @@ def test_spatial_structures_edge_cases():
     # Test with very small values
     pose.position = [1e-10, -1e-10, 0.0]
     pose.orientation = [1e-6, -1e-6, 0.0]
-    print(
-        f"     Small values: position={pose.position}, orientation={pose.orientation}"
-    )
+    if VERBOSE:
+        print(
+            f"     Small values: position={pose.position}, orientation={pose.orientation}"
+        )
 
     # Test with very large values
     pose.position = [1e6, -1e6, 0.0]
     pose.orientation = [math.pi, -math.pi, 2 * math.pi]
-    print(
-        f"     Large values: position={pose.position}, orientation={pose.orientation}"
-    )
+    if VERBOSE:
+        print(
+            f"     Large values: position={pose.position}, orientation={pose.orientation}"
+        )
 
     # Test Point2D edge cases
     print("   Testing Point2D edge cases:")
@@ -322,19 +316,22 @@ def test_spatial_structures_edge_cases():
     # Test with very small values
     point.x = 1e-10
     point.y = -1e-10
-    print(f"     Small values: x={point.x}, y={point.y}")
+    if VERBOSE:
+        print(f"     Small values: x={point.x}, y={point.y}")
 
     # Test with very large values
     point.x = 1e6
     point.y = -1e6
-    print(f"     Large values: x={point.x}, y={point.y}")
+    if VERBOSE:
+        print(f"     Large values: x={point.x}, y={point.y}")
 
     # Test PolyRegion edge cases
     print("   Testing PolyRegion edge cases:")
     poly_region = magicbot.PolyRegion()
 
     # Test with empty region
-    print(f"     Empty region: {len(poly_region.points)} points")
+    if VERBOSE:
+        print(f"     Empty region: {len(poly_region.points)} points")
     assert len(poly_region.points) == 0
 
     # Test with single point
@@ -342,19 +339,20 @@ def test_spatial_structures_edge_cases():
     single_point.x = 1.0
     single_point.y = 2.0
     poly_region.points.append(single_point)
-    print(f"     Single point region: {len(poly_region.points)} points")
+    if VERBOSE:
+        print(f"     Single point region: {len(poly_region.points)} points")
     assert len(poly_region.points) == 1
 
     # Test with many points (complex polygon)
     poly_region.points.clear()
-    for i in range(10):
+    for x, y in _CIRCLE_COORDS:
         point = magicbot.Point2D()
-        angle = 2 * math.pi * i / 10
-        point.x = math.cos(angle)
-        point.y = math.sin(angle)
+        point.x = x
+        point.y = y
         poly_region.points.append(point)
 
-    print(f"     Complex polygon: {len(poly_region.points)} points")
+    if VERBOSE:
+        print(f"     Complex polygon: {len(poly_region.points)} points")
     assert len(poly_region.points) == 10
 
     print("   ✓ Edge cases test passed")
@@ -363,34 +361,32 @@ def test_spatial_structures_edge_cases():
 
 def main():
     """Main test function"""
-    try:
-        print("Starting Spatial Structures binding tests...")
-        print("=" * 60)
-
-        test_pose3d_euler()
-        test_point2d()
-        test_poly_region()
-        test_spatial_structures_comprehensive()
-        test_spatial_structures_edge_cases()
-
-        print("\n" + "=" * 60)
-        print("🎉 All Spatial Structures binding tests completed successfully!")
-        print("\nSummary:")
-        print("  ✓ Pose3DEuler - position (x,y,z), orientation (roll,pitch,yaw)")
-        print("  ✓ Point2D - x, y coordinates")
-        print("  ✓ PolyRegion - points array for polygonal regions")
-        print("  ✓ Comprehensive spatial scene with multiple objects")
-        print("  ✓ Edge cases with extreme values and empty/single/many points")
-
-        return 0
-
-    except Exception as e:
-        print(f"\n❌ Test failed with error: {e}")
-        import traceback
-
-        traceback.print_exc()
+    magicbot = get_magicbot()
+
+    print("Starting Spatial Structures binding tests...")
+    print("=" * 60)
+
+    tests = (
+        test_pose3d_euler,
+        test_point2d,
+        test_poly_region,
+        test_spatial_structures_comprehensive,
+        test_spatial_structures_edge_cases,
+    )
+    if run_all([partial(test, magicbot) for test in tests]):
         return 1
 
+    print("\n" + "=" * 60)
+    print("🎉 All Spatial Structures binding tests completed successfully!")
+    print("\nSummary:")
+    print("  ✓ Pose3DEuler - position (x,y,z), orientation (roll,pitch,yaw)")
+    print("  ✓ Point2D - x, y coordinates")
+    print("  ✓ PolyRegion - points array for polygonal regions")
+    print("  ✓ Comprehensive spatial scene with multiple objects")
+    print("  ✓ Edge cases with extreme values and empty/single/many points")
+
+    return 0
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -6,47 +6,45 @@ Tests basic read/write operations for all fields
 
 import sys
 import os
+from _pytest_compat import pytest
+from _import_helper import get_magicbot
 
-# Add the parent directory to the path to import magicbot_z1_python
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Field values are only printed when MAGICBOT_TEST_VERBOSE=1
+VERBOSE = os.environ.get("MAGICBOT_TEST_VERBOSE") == "1"
+
+# TtsPriority members written to and read back from TtsCommand.priority
+_PRIORITY_NAMES = (
+    "HIGH",  # 最高优先级
+    "MIDDLE",  # 中优先级
+    "LOW",  # 最低优先级
+)
+
+# TtsMode members written to and read back from TtsCommand.mode
+_MODE_NAMES = (
+    "CLEARTOP",  # 清空当前优先级所有任务
+    "ADD",  # 追加到队列尾部
+    "CLEARBUFFER",  # 清空队列中未播放的请求
 )
 
-try:
-    import magicbot_z1_python as magicbot
-except ImportError as e:
-    print(f"Error importing magicbot_z1_python: {e}")
-    print("\n🔧 Troubleshooting steps:")
-    print("1. Make sure the SDK is built:")
-    print("   cd /path/to/magicbot_z1_sdk")
-    print("   chmod +x build.sh")
-    print("   ./build.sh")
-    print("\n2. If the module is built but not installed, you may need to:")
-    print("   - Add the build directory to PYTHONPATH")
-    print("   - Or install the module to your Python environment")
-    print("\n3. Check if the module exists in the build directory:")
-    print("   find . -name '*magicbot*' -type f")
-    print("\n4. If you're in a development environment, you might need to:")
-    print("   export PYTHONPATH=/path/to/magicbot_z1_sdk/build:$PYTHONPATH")
-    print(
-        "\n📝 For now, this test will show the expected structure without running actual tests."
-    )
-
-    # Create a mock module for demonstration
-    class MockMagicbot:
-        class TtsCommand:
-            def __init__(self):
-                self.id = ""
-                self.content = ""
-                self.priority = 0
-                self.mode = 0
-
-    magicbot = MockMagicbot()
-    print("\n✅ Using mock module for demonstration purposes.")
-    print("   (Replace with actual module when available)")
-
-
-def test_tts_command_initial_values():
+
+def _enum_pairs(enum, names):
+    """Resolve the named enum members once, as (value, name) pairs"""
+    return tuple((getattr(enum, name), name) for name in names)
+
+
+@pytest.fixture(scope="module")
+def tts_priorities(magicbot):
+    """(TtsPriority member, name) pairs, resolved once per module"""
+    return _enum_pairs(magicbot.TtsPriority, _PRIORITY_NAMES)
+
+
+@pytest.fixture(scope="module")
+def tts_modes(magicbot):
+    """(TtsMode member, name) pairs, resolved once per module"""
+    return _enum_pairs(magicbot.TtsMode, _MODE_NAMES)
+
+
+def test_tts_command_initial_values(magicbot):
     """Test TtsCommand initial values"""
     print("=== Testing TtsCommand Initial Values ===")
 
@@ -54,10 +52,11 @@ def test_tts_command_initial_values():
 
     # Test initial values
     print("   Testing initial values:")
-    print(f"     id: '{tts_cmd.id}'")
-    print(f"     content: '{tts_cmd.content}'")
-    print(f"     priority: {tts_cmd.priority}")
-    print(f"     mode: {tts_cmd.mode}")
+    if VERBOSE:
+        print(f"     id: '{tts_cmd.id}'")
+        print(f"     content: '{tts_cmd.content}'")
+        print(f"     priority: {tts_cmd.priority}")
+        print(f"     mode: {tts_cmd.mode}")
 
     # Verify initial values
     assert tts_cmd.id == ""
@@ -69,7 +68,7 @@ def test_tts_command_initial_values():
     return True
 
 
-def test_tts_command_id():
+def test_tts_command_id(magicbot):
     """Test TtsCommand id field"""
     print("\n=== Testing TtsCommand ID ===")
 
@@ -81,20 +80,18 @@ def test_tts_command_id():
 
     for test_id in test_ids:
         tts_cmd.id = test_id
-        print(f"     Set id: '{tts_cmd.id}'")
         assert tts_cmd.id == test_id, f"ID should be '{test_id}', got '{tts_cmd.id}'"
-        print(f"     ✓ ID '{test_id}' test passed")
+    print(f"     ✓ {len(test_ids)} IDs test passed")
 
     # Test empty ID
     tts_cmd.id = ""
-    print(f"     Set empty id: '{tts_cmd.id}'")
     assert tts_cmd.id == ""
     print("     ✓ Empty ID test passed")
 
     return True
 
 
-def test_tts_command_content():
+def test_tts_command_content(magicbot):
     """Test TtsCommand content field"""
     print("\n=== Testing TtsCommand Content ===")
 
@@ -112,22 +109,20 @@ def test_tts_command_content():
 
     for content in test_contents:
         tts_cmd.content = content
-        print(f"     Set content: '{tts_cmd.content}'")
         assert (
             tts_cmd.content == content
         ), f"Content should be '{content}', got '{tts_cmd.content}'"
-        print(f"     ✓ Content test passed")
+    print(f"     ✓ {len(test_contents)} contents test passed")
 
     # Test empty content
     tts_cmd.content = ""
-    print(f"     Set empty content: '{tts_cmd.content}'")
     assert tts_cmd.content == ""
     print("     ✓ Empty content test passed")
 
     return True
 
 
-def test_tts_command_priority():
+def test_tts_command_priority(magicbot, tts_priorities):
     """Test TtsCommand priority field"""
     print("\n=== Testing TtsCommand Priority ===")
 
@@ -135,25 +130,17 @@ def test_tts_command_priority():
 
     # Test priority values (based on TtsPriority enum)
     print("   Testing priority values:")
-    priorities = {
-        magicbot.TtsPriority.HIGH: "HIGH",  # 最高优先级
-        magicbot.TtsPriority.MIDDLE: "MIDDLE",  # 中优先级
-        magicbot.TtsPriority.LOW: "LOW",  # 最低优先级
-    }
-
-    for priority_value, priority_name in priorities.items():
+    for priority_value, priority_name in tts_priorities:
         tts_cmd.priority = priority_value
-        print(f"     Set priority: {priority_value} ({priority_name})")
-        print(f"     Get priority: {tts_cmd.priority}")
         assert (
             tts_cmd.priority == priority_value
-        ), f"Priority should be {priority_value}, got {tts_cmd.priority}"
-        print(f"     ✓ Priority {priority_value} ({priority_name}) test passed")
+        ), f"Priority should be {priority_value} ({priority_name}), got {tts_cmd.priority}"
+    print(f"     ✓ Priorities {', '.join(_PRIORITY_NAMES)} test passed")
 
     return True
 
 
-def test_tts_command_mode():
+def test_tts_command_mode(magicbot, tts_modes):
     """Test TtsCommand mode field"""
     print("\n=== Testing TtsCommand Mode ===")
 
@@ -161,35 +148,31 @@ def test_tts_command_mode():
 
     # Test mode values (based on TtsMode enum)
     print("   Testing mode values:")
-    modes = {
-        magicbot.TtsMode.CLEARTOP: "CLEARTOP",  # 清空当前优先级所有任务
-        magicbot.TtsMode.ADD: "ADD",  # 追加到队列尾部
-        magicbot.TtsMode.CLEARBUFFER: "CLEARBUFFER",  # 清空队列中未播放的请求
-    }
-
-    for mode_value, mode_name in modes.items():
+    for mode_value, mode_name in tts_modes:
         tts_cmd.mode = mode_value
-        print(f"     Set mode: {mode_value} ({mode_name})")
-        print(f"     Get mode: {tts_cmd.mode}")
         assert (
             tts_cmd.mode == mode_value
-        ), f"Mode should be {mode_value}, got {tts_cmd.mode}"
-        print(f"     ✓ Mode {mode_value} ({mode_name}) test passed")
+        ), f"Mode should be {mode_value} ({mode_name}), got {tts_cmd.mode}"
+    print(f"     ✓ Modes {', '.join(_MODE_NAMES)} test passed")
 
     return True
 
 
 def main():
     """Main test function"""
+    magicbot = get_magicbot()
+
     try:
         print("Starting RobotState binding tests...")
         print("=" * 50)
 
-        test_tts_command_initial_values()
-        test_tts_command_id()
-        test_tts_command_content()
-        test_tts_command_priority()
-        test_tts_command_mode()
+        test_tts_command_initial_values(magicbot)
+        test_tts_command_id(magicbot)
+        test_tts_command_content(magicbot)
+        test_tts_command_priority(
+            magicbot, _enum_pairs(magicbot.TtsPriority, _PRIORITY_NAMES)
+        )
+        test_tts_command_mode(magicbot, _enum_pairs(magicbot.TtsMode, _MODE_NAMES))
 
         print("\n" + "=" * 50)
         print("🎉 All RobotState binding tests completed successfully!")
@@ -19,8 +19,13 @@ logging.basicConfig(
 
 # Global variables
 robot: Optional[magicbot.MagicRobot] = None
+# Fetched once in main() and shared by all handlers
+audio_controller: Optional[magicbot.AudioController] = None
 running = True
 
+# Minimum time in seconds between audio stream log lines
+AUDIO_LOG_INTERVAL = 1.0
+
 
 def signal_handler(signum, frame):
     """Signal handler function for graceful exit"""
@@ -61,10 +66,9 @@ def print_help():
 
 def get_volume():
     """Get volume"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Get volume
         status, volume = controller.get_volume()
@@ -83,10 +87,9 @@ def get_volume():
 
 def set_volume(volume):
     """Set volume"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Set volume to 7
         status = controller.set_volume(volume)
@@ -105,10 +108,9 @@ def set_volume(volume):
 
 def play_tts(content):
     """Play TTS speech"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Create TTS command
         tts = magicbot.TtsCommand()
@@ -132,10 +134,9 @@ def play_tts(content):
 
 def stop_tts():
     """Stop TTS playback"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Stop speech playback
         status = controller.stop()
@@ -152,10 +153,9 @@ def stop_tts():
 
 def open_audio_stream():
     """Open audio stream"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Open audio stream
         status = controller.open_audio_stream()
@@ -174,10 +174,9 @@ def open_audio_stream():
 
 def close_audio_stream():
     """Close audio stream"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Close audio stream
         status = controller.close_audio_stream()
@@ -196,37 +195,39 @@ def close_audio_stream():
 
 def subscribe_audio_stream():
     """Subscribe to audio stream"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
-        # Audio stream counters
-        origin_counter = 0
-        bf_counter = 0
+        # Time of the last log line per stream, so logging stays at most once
+        # per AUDIO_LOG_INTERVAL whatever rate the streams deliver frames at
+        last_origin_log = 0.0
+        last_bf_log = 0.0
 
         def origin_audio_callback(audio_stream):
             """Original audio stream callback function"""
-            nonlocal origin_counter
-            if origin_counter % 30 == 0:
+            nonlocal last_origin_log
+            now = time.monotonic()
+            if now - last_origin_log >= AUDIO_LOG_INTERVAL:
+                last_origin_log = now
                 logging.info(
                     "Received original audio stream data, size: %d",
                     audio_stream.data_length,
                 )
                 sys.stdout.write("\r")
                 sys.stdout.flush()
-            origin_counter += 1
 
         def bf_audio_callback(audio_stream):
             """BF audio stream callback function"""
-            nonlocal bf_counter
-            if bf_counter % 30 == 0:
+            nonlocal last_bf_log
+            now = time.monotonic()
+            if now - last_bf_log >= AUDIO_LOG_INTERVAL:
+                last_bf_log = now
                 logging.info(
                     "Received BF audio stream data, size: %d", audio_stream.data_length
                 )
                 sys.stdout.write("\r")
                 sys.stdout.flush()
-            bf_counter += 1
 
         # Subscribe to audio streams
         controller.subscribe_origin_audio_stream(origin_audio_callback)
@@ -239,10 +240,9 @@ def subscribe_audio_stream():
 
 def unsubscribe_audio_stream():
     """Unsubscribe to audio stream"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Unsubscribe to audio stream
         controller.unsubscribe_bf_audio_stream()
@@ -255,10 +255,9 @@ def unsubscribe_audio_stream():
 
 def open_wakeup_status_stream():
     """Open wakeup status stream"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Open wakeup status stream
         status = controller.open_wakeup_status_stream()
@@ -277,10 +276,9 @@ def open_wakeup_status_stream():
 
 def close_wakeup_status_stream():
     """Close wakeup status stream"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Close wakeup status stream
         status = controller.close_wakeup_status_stream()
@@ -299,10 +297,9 @@ def close_wakeup_status_stream():
 
 def unsubscribe_wakeup_status():
     """Unsubscribe to wakeup status"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Unsubscribe to wakeup status
         controller.unsubscribe_wakeup_status()
@@ -314,10 +311,9 @@ def unsubscribe_wakeup_status():
 
 def subscribe_wakeup_status():
     """Subscribe to wakeup status"""
-    global robot
+    global audio_controller
     try:
-        # Get audio controller
-        controller = robot.get_audio_controller()
+        controller = audio_controller
 
         # Wakeup status counter
         wakeup_counter = 0
@@ -356,17 +352,39 @@ def subscribe_wakeup_status():
 
 
 def get_user_input():
-    """Get user input - Read a single line of data"""
+    """Get user input - Read a single line of data, or None once stdin is closed"""
     try:
         # Method 1: Read a line using input() (recommended)
         return input("Enter command: ").strip()
     except (EOFError, KeyboardInterrupt):
-        return ""
+        return None
+
+
+# Command key (upper-cased) -> handler called with the command's arguments
+_KEY_HANDLERS = {
+    # 1. Audio Functions
+    "1": lambda args: get_volume(),
+    "2": lambda args: set_volume(args[0] if args else 50),
+    "3": lambda args: play_tts(args[0] if args else "How's the weather today!"),
+    "4": lambda args: stop_tts(),
+    # 2. Audio Stream Functions
+    "5": lambda args: open_audio_stream(),
+    "6": lambda args: close_audio_stream(),
+    "7": lambda args: subscribe_audio_stream(),
+    "8": lambda args: unsubscribe_audio_stream(),
+    # 3. Wakeup Status Functions
+    "Q": lambda args: open_wakeup_status_stream(),
+    "W": lambda args: close_wakeup_status_stream(),
+    "E": lambda args: subscribe_wakeup_status(),
+    "R": lambda args: unsubscribe_wakeup_status(),
+    # 4. Print help information
+    "?": lambda args: print_help(),
+}
 
 
 def main():
     """Main function"""
-    global robot, running
+    global robot, running, audio_controller
 
     # Bind signal handler
     signal.signal(signal.SIGINT, signal_handler)
@@ -412,13 +430,15 @@ def main():
         # Main loop
         while running:
             try:
+                # input() blocks until a line arrives, so the loop needs no delay
                 str_input = get_user_input()
+                if str_input is None:
+                    break
 
                 # Split input parameters by space
                 parts = str_input.strip().split()
 
                 if not parts:
-                    time.sleep(0.01)  # Brief delay
                     continue
 
                 # Parse parameters
@@ -426,54 +446,12 @@ def main():
                 args = parts[1:] if len(parts) > 1 else []
                 if key == "\x1b":  # ESC key
                     break
-                # 1. Audio Functions
-                # 1.1 Get volume
-                if key == "1":
-                    get_volume()
-                # 1.2 Set volume
-                elif key == "2":
-                    volume = args[0] if args else 50
-                    set_volume(volume)
-                # 1.3 Play TTS
-                elif key == "3":
-                    content = args[0] if args else "How's the weather today!"
-                    play_tts(content)
-                # 1.4 Stop TTS
-                elif key == "4":
-                    stop_tts()
-                # 2. Audio Stream Functions
-                # 2.1 Open audio stream
-                elif key == "5":
-                    open_audio_stream()
-                # 2.2 Close audio stream
-                elif key == "6":
-                    close_audio_stream()
-                # 2.3 Subscribe to audio stream
-                elif key == "7":
-                    subscribe_audio_stream()
-                # 2.4 Unsubscribe from audio stream
-                elif key.upper() == "8":
-                    unsubscribe_audio_stream()
-                # 3. Wakeup Status Functions
-                # 3.1 Open wakeup status stream
-                elif key.upper() == "Q":
-                    open_wakeup_status_stream()
-                # 3.2 Close wakeup status stream
-                elif key.upper() == "W":
-                    close_wakeup_status_stream()
-                # 3.3 Subscribe to wakeup status stream
-                elif key.upper() == "E":
-                    subscribe_wakeup_status()
-                # 3.4 Unsubscribe from wakeup status stream
-                elif key.upper() == "R":
-                    unsubscribe_wakeup_status()
-                # 4. Print help information
-                elif key.upper() == "?":
-                    print_help()
-                else:
-                    logging.warning("Unknown key: %s", key)
 
-                time.sleep(0.01)  # Brief delay
+                handler = _KEY_HANDLERS.get(key.upper())
+                if handler is None:
+                    logging.warning("Unknown key: %s", key)
+                else:
+                    handler(args)
 
             except KeyboardInterrupt:
                 break
@@ -487,10 +465,10 @@ def main():
         # Clean up resources
         try:
             logging.info("Clean up resources")
-            # Close sensor controller
-            audio_controller = robot.get_audio_controller()
-            audio_controller.shutdown()
-            logging.info("Audio controller closed")
+            # Close audio controller
+            if audio_controller is not None:
+                audio_controller.shutdown()
+                logging.info("Audio controller closed")
 
             # Disconnect
             robot.disconnect()